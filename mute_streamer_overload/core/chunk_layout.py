@@ -0,0 +1,93 @@
+from functools import lru_cache
+
+
+class ChunkLayout:
+    """Immutable word/chunk layout of a message.
+
+    Words are grouped into chunks of at most max_chars characters (a single
+    word longer than that gets a chunk of its own). Each chunk's text is
+    joined once; frame i is the prefix of its chunk's text up to and
+    including word i, sliced from that shared buffer. Indexing yields
+    (text, pause) tuples, where pause is the number of word intervals to
+    wait afterwards: two at the end of a chunk that has a successor, one
+    otherwise.
+    """
+    __slots__ = ('words', 'chunks', 'chunk_texts', 'min_chars', 'max_chars',
+                 '_frame_chunk', '_frame_end')
+
+    def __init__(self, words, bounds, min_chars, max_chars):
+        self.words = words
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        chunks = []
+        chunk_texts = []
+        frame_chunk = []
+        frame_end = []
+        for chunk_index, (start, end) in enumerate(bounds):
+            offset = -1
+            for i in range(start, end):
+                offset += 1 + len(words[i])
+                frame_chunk.append(chunk_index)
+                frame_end.append(offset)
+            chunks.append((start, end))
+            chunk_texts.append(' '.join(words[start:end]))
+        self.chunks = tuple(chunks)
+        self.chunk_texts = tuple(chunk_texts)
+        self._frame_chunk = tuple(frame_chunk)
+        self._frame_end = tuple(frame_end)
+
+    def __len__(self):
+        return len(self.words)
+
+    def __getitem__(self, index):
+        return self.frame_text(index), self.pause(index)
+
+    def frame_text(self, index):
+        return self.chunk_texts[self._frame_chunk[index]][:self._frame_end[index]]
+
+    def pause(self, index):
+        chunk = self._frame_chunk[index]
+        if index == self.chunks[chunk][1] - 1 and chunk < len(self.chunks) - 1:
+            return 2
+        return 1
+
+    def chunk_of(self, index):
+        return self._frame_chunk[index]
+
+
+def _chunk_bounds(words, min_chars, max_chars):
+    """Greedy chunk boundaries as (start, end) word index pairs"""
+    bounds = []
+    start = 0
+    length = 0
+    lengths = []
+    for i, word in enumerate(words):
+        if i > start and length + 1 + len(word) > max_chars:
+            bounds.append((start, i))
+            lengths.append(length)
+            start, length = i, 0
+        length += len(word) if i == start else 1 + len(word)
+    if words:
+        bounds.append((start, len(words)))
+        lengths.append(length)
+    # Don't leave a short tail: borrow words from the previous chunk while
+    # that keeps it at min_chars and the tail within max_chars.
+    if len(bounds) > 1 and lengths[-1] < min_chars:
+        (prev_start, prev_end), (_, end) = bounds[-2], bounds[-1]
+        prev_len, tail_len = lengths[-2], lengths[-1]
+        while prev_end - prev_start > 1 and tail_len < min_chars:
+            moved = len(words[prev_end - 1])
+            if prev_len - moved - 1 < min_chars or tail_len + moved + 1 > max_chars:
+                break
+            prev_end -= 1
+            prev_len -= moved + 1
+            tail_len += moved + 1
+        bounds[-2:] = [(prev_start, prev_end), (prev_end, end)]
+    return bounds
+
+
+@lru_cache(maxsize=64)
+def layout_chunks(message, min_chars, max_chars):
+    """Tokenize message once and lay it out into chunks; cached by (message, limits)"""
+    words = tuple(message.split())
+    return ChunkLayout(words, _chunk_bounds(words, min_chars, max_chars), min_chars, max_chars)
@@ -0,0 +1,90 @@
+import math
+import threading
+from functools import lru_cache
+
+from mute_streamer_overload.core.scheduler import get_scheduler
+
+# Opacity steps per second of fade; a fade costs duration * FADE_FPS repaints
+FADE_FPS = 60
+
+
+@lru_cache(maxsize=32)
+def fade_curve(duration, fps=FADE_FPS):
+    """Eased (ease-out cubic) progress values in (0, 1] for a fade of duration seconds.
+
+    The starting value is left out, so every step is a visible change and
+    the last one is exactly 1.0.
+    """
+    steps = max(1, math.ceil(duration * fps))
+    return tuple(1 - (1 - i / steps) ** 3 for i in range(1, steps + 1))
+
+
+class Fader:
+    """Plays opacity fades on the shared scheduler.
+
+    on_opacity(value) is called from the scheduler thread for every step of
+    a precomputed curve. Steps have absolute deadlines; if the scheduler
+    falls behind, missed steps are skipped rather than played late, so a
+    fade always ends on time.
+    """
+
+    def __init__(self, on_opacity, opacity=1.0, scheduler=None):
+        self.on_opacity = on_opacity
+        self.opacity = opacity
+        self._scheduler = scheduler if scheduler is not None else get_scheduler()
+        self._pending_timer = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def fade_to(self, target, duration, delay=0.0):
+        """Fade from the current opacity to target over duration, starting after delay"""
+        with self._lock:
+            self._cancel_pending()
+            start_value = self.opacity
+            if start_value == target and delay <= 0:
+                return
+            curve = fade_curve(duration) if duration > 0 else (1.0,)
+            step = duration / len(curve)
+            start = self._scheduler.now() + delay
+            generation = self._generation
+            self._pending_timer = self._scheduler.call_at(
+                start + step, self._step, generation, start, step, start_value, target, curve, 0)
+
+    def set_opacity(self, value):
+        """Jump straight to value, cancelling any fade in progress"""
+        with self._lock:
+            self._cancel_pending()
+            self.opacity = value
+        self.on_opacity(value)
+
+    def cancel(self):
+        with self._lock:
+            self._cancel_pending()
+
+    def is_fading(self):
+        return self._pending_timer is not None
+
+    def _cancel_pending(self):
+        self._generation += 1
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+
+    def _step(self, generation, start, step, start_value, target, curve, index):
+        with self._lock:
+            if generation != self._generation:
+                return
+            if step > 0:
+                due = int((self._scheduler.now() - start) / step + 1e-9) - 1
+                index = min(max(index, due), len(curve) - 1)
+            else:
+                index = len(curve) - 1
+            value = start_value + (target - start_value) * curve[index]
+            self.opacity = value
+            if index + 1 < len(curve):
+                self._pending_timer = self._scheduler.call_at(
+                    start + (index + 2) * step, self._step, generation,
+                    start, step, start_value, target, curve, index + 1)
+            else:
+                self._pending_timer = None
+        self.on_opacity(value)
@@ -0,0 +1,75 @@
+import logging
+from functools import partial
+
+import keyboard
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_hotkey(key):
+    return key.strip().lower().replace(' ', '')
+
+
+class HotkeyManager:
+    """Owns the app's global keyboard hooks.
+
+    The suppressing typing hook (InputHandler.on_key_event) only exists
+    while typing mode is on: install() follows input_state_changed, hooking
+    when typing starts and unhooking when it ends, so an idle app puts no
+    Python callback in front of every keystroke on the system.
+
+    Start hotkeys stay registered in both modes. on_hotkey_press() ignores
+    them while typing, and keeping them avoids tearing down and rebuilding
+    every registration on each mode switch. They are kept in a table;
+    set_start_hotkeys() only adds or removes the entries that changed.
+    """
+
+    def __init__(self, input_handler):
+        self.input_handler = input_handler
+        self._typing_hook = None
+        self._installed = False
+        self._start_hooks = {}  # (key, suppress) -> keyboard remove function
+
+    def install(self):
+        """Start following the input handler's typing mode"""
+        if not self._installed:
+            self._installed = True
+            self.input_handler.input_state_changed.connect(self._on_input_state_changed)
+            self._on_input_state_changed(self.input_handler.is_active)
+
+    def _on_input_state_changed(self, active):
+        if active and self._typing_hook is None:
+            self._typing_hook = keyboard.hook(self.input_handler.on_key_event, suppress=True)
+        elif not active and self._typing_hook is not None:
+            self._remove(self._typing_hook)
+            self._typing_hook = None
+
+    def set_start_hotkeys(self, keys, suppress=False):
+        wanted = {(normalize_hotkey(key), suppress) for key in keys if key.strip()}
+        for entry in set(self._start_hooks) - wanted:
+            self._remove(self._start_hooks.pop(entry))
+        for key, key_suppress in wanted - set(self._start_hooks):
+            try:
+                self._start_hooks[(key, key_suppress)] = keyboard.on_press_key(
+                    key, partial(self._on_start_key, key=key), suppress=key_suppress)
+            except ValueError as e:
+                logger.error(f"[HOTKEY] Could not register start hotkey {key!r}: {e}")
+
+    def shutdown(self):
+        """Remove every hook this manager installed"""
+        for remove in self._start_hooks.values():
+            self._remove(remove)
+        self._start_hooks.clear()
+        if self._typing_hook is not None:
+            self._remove(self._typing_hook)
+            self._typing_hook = None
+
+    def _on_start_key(self, event, key):
+        logger.debug(f"[HOTKEY] Start hotkey pressed: {key}")
+        return self.input_handler.on_hotkey_press(event, 'start', key)
+
+    def _remove(self, remove):
+        try:
+            remove()
+        except (KeyError, ValueError):
+            pass
@@ -0,0 +1,122 @@
+import os
+
+
+def text_delta(old, new):
+    """Smallest (keep, insert) edit turning old into new: new == old[:keep] + insert"""
+    if new.startswith(old):
+        return len(old), new[len(old):]
+    keep = len(os.path.commonprefix((old, new)))
+    return keep, new[keep:]
+
+
+class InputBuffer:
+    """Mutable text buffer with a cursor, stored as a gap buffer.
+
+    Characters left of the cursor live in one list and characters right of
+    it (reversed) in another, so typing, backspace, delete and moving the
+    cursor by one character are O(1). A selection runs from anchor to the
+    cursor; typing or deleting replaces it. The text is only joined into a
+    string when text() is called, which is cached until the next edit.
+    """
+
+    def __init__(self, text=""):
+        self._before = list(text)
+        self._after = []
+        self.anchor = None
+        self.version = 0
+        self._text = text
+
+    def __len__(self):
+        return len(self._before) + len(self._after)
+
+    @property
+    def cursor(self):
+        return len(self._before)
+
+    def text(self):
+        if self._text is None:
+            self._text = ''.join(self._before) + ''.join(reversed(self._after))
+        return self._text
+
+    def selection(self):
+        """(start, end) of the selection, or None"""
+        if self.anchor is None or self.anchor == self.cursor:
+            return None
+        return min(self.anchor, self.cursor), max(self.anchor, self.cursor)
+
+    def _changed(self):
+        self.version += 1
+        self._text = None
+
+    def insert(self, chars):
+        self._delete_selection()
+        self._before.extend(chars)
+        self._changed()
+
+    def backspace(self):
+        if self._delete_selection():
+            self._changed()
+        elif self._before:
+            self._before.pop()
+            self._changed()
+
+    def delete(self):
+        if self._delete_selection():
+            self._changed()
+        elif self._after:
+            self._after.pop()
+            self._changed()
+
+    def move_left(self, select=False):
+        self._start_selection(select)
+        if self._before:
+            self._after.append(self._before.pop())
+
+    def move_right(self, select=False):
+        self._start_selection(select)
+        if self._after:
+            self._before.append(self._after.pop())
+
+    def move_home(self, select=False):
+        self.move_to(0, select)
+
+    def move_end(self, select=False):
+        self.move_to(len(self), select)
+
+    def move_to(self, position, select=False):
+        """Put the cursor at position; costs the distance moved"""
+        self._start_selection(select)
+        position = max(0, min(position, len(self)))
+        while self.cursor > position:
+            self._after.append(self._before.pop())
+        while self.cursor < position:
+            self._before.append(self._after.pop())
+
+    def select_all(self):
+        self.move_end()
+        self.anchor = 0
+
+    def clear(self):
+        self._before.clear()
+        self._after.clear()
+        self.anchor = None
+        self._changed()
+
+    def _start_selection(self, select):
+        if not select:
+            self.anchor = None
+        elif self.anchor is None:
+            self.anchor = self.cursor
+
+    def _delete_selection(self):
+        """Remove the selected characters; returns True if there were any"""
+        selection = self.selection()
+        self.anchor = None
+        if selection is None:
+            return False
+        start, end = selection
+        if self.cursor == end:
+            del self._before[start:]
+        else:
+            del self._after[len(self) - end:]
+        return True
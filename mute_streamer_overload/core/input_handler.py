@@ -1,7 +1,18 @@
 import keyboard
-import time
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-from mute_streamer_overload.utils.config import get_config
+import threading
+from collections import deque
+from PyQt6.QtCore import QObject, pyqtSignal
+from mute_streamer_overload.core.input_buffer import InputBuffer, text_delta
+from mute_streamer_overload.core.scheduler import get_scheduler
+from mute_streamer_overload.utils.config import config_key, get_config
+
+SHIFT_KEYS = frozenset(('shift', 'left shift', 'right shift'))
+
+# text_updated is emitted at most once per display frame while typing
+FRAME_INTERVAL = 1 / 60
+
+# Read on every keystroke
+SPECULATIVE_DELAY_MS = config_key("tts.speculative_delay_ms", 400)
 
 class InputHandler(QObject):
     """Class to handle input in a separate thread"""
@@ -9,39 +20,71 @@ class InputHandler(QObject):
     input_state_changed = pyqtSignal(bool)
     start_typing_signal = pyqtSignal()
     submit_signal = pyqtSignal()
+    # Live preview: (chars kept, text inserted after them), at most once per frame
+    preview_delta = pyqtSignal(int, str)
+    # Typing went quiet for tts.speculative_delay_ms; carries the text so far
+    typing_paused = pyqtSignal(str)
     
-    def __init__(self):
+    def __init__(self, scheduler=None):
         super().__init__()
         self.is_active = False
-        self.temp_input = ""
+        self.buffer = InputBuffer()
         self.last_key_time = 0
-        self.timer = QTimer()
-        self.timer.timeout.connect(self.process_input)
-        self.timer.start(1)  # Process input every 1ms for maximum responsiveness
         self.f4_pressed = False
+        # Raw (name, shift, time) key-downs from the hook, drained by the worker
+        self._events = deque()
+        self._wakeup = threading.Event()
+        self._worker = None
+        self._shift_down = set()
+        # Guards the buffer between the worker, the flush timer and the GUI thread
+        self._buffer_lock = threading.Lock()
+        self._scheduler = scheduler if scheduler is not None else get_scheduler()
+        self._flush_timer = None
+        self._last_flush = float('-inf')
+        self._emitted_version = self.buffer.version
+        self.live_preview = get_config("input.live_preview", False)
+        self._preview_text = ""
+        self._pause_timer = None
         self.update_submit_hotkeys()
     
     def update_submit_hotkeys(self):
         # Normalize submit hotkeys to lowercase, no spaces
         self.submit_hotkeys = set(k.strip().lower().replace(' ', '') for k in get_config("input.submit_hotkey", ["F4"]))
     
+    def set_live_preview(self, enabled):
+        """Stream the in-progress text to the overlays while typing"""
+        self.live_preview = enabled
+        if not enabled:
+            self._end_preview()
+
     def toggle_input(self):
         """Toggle input state"""
-        try:
-            self.is_active = not self.is_active
-            if not self.is_active:
-                self.temp_input = ""
-                keyboard.unhook_all()
-            else:
-                keyboard.unhook_all()
-                keyboard.hook(self.on_key_event, suppress=True)
-                self.update_submit_hotkeys()
-            self.input_state_changed.emit(self.is_active)
-        except Exception as e:
-            print(f"Error toggling input: {e}")
+        self.set_active(not self.is_active)
+
+    def set_active(self, active):
+        """Switch between idle and typing mode.
+
+        HotkeyManager installs the suppressing keyboard hook on
+        input_state_changed(True) and removes it on input_state_changed(False).
+        """
+        if active == self.is_active:
+            return
+        if active:
+            self._events.clear()
+            try:
+                # Seed the local modifier state once; the hook tracks it from here
+                self._shift_down = {'shift'} if keyboard.is_pressed('shift') else set()
+            except Exception as e:
+                print(f"Error reading shift state: {e}")
+                self._shift_down = set()
+            self.update_submit_hotkeys()
+            self._ensure_worker()
+            self.is_active = True
+        else:
             self.is_active = False
-            keyboard.unhook_all()
-            self.input_state_changed.emit(False)
+            self._reset_buffer()
+            self._end_preview()
+        self.input_state_changed.emit(self.is_active)
     
     def on_hotkey_press(self, event, action, key):
         print(f"[DEBUG] on_hotkey_press called: event={event}, action={action}, key={key}")
@@ -53,49 +96,154 @@ class InputHandler(QObject):
                 self.submit_signal.emit()
         return False
     
-    def process_input(self):
-        pass  # No longer needed for hotkey debounce
-    
     def on_key_event(self, event):
+        """Keyboard hook callback; runs on the OS hook thread for every keystroke.
+
+        Kept to the bare minimum so other apps never wait on us: track
+        shift locally, append the raw event to the queue and return the
+        suppress decision. Everything else happens on the input worker.
+        """
         if not self.is_active:
             return True
-        try:
-            # Check for submit hotkey
+        name = event.name
+        if name in SHIFT_KEYS:
             if event.event_type == keyboard.KEY_DOWN:
-                key_name = event.name.lower().replace(' ', '')
-                if key_name in self.submit_hotkeys:
-                    self.submit_signal.emit()
-                    return False
-                if event.name == 'backspace':
-                    self.temp_input = self.temp_input[:-1]
-                    self.text_updated.emit(self.temp_input)
-                    return False
-                elif event.name == 'enter':
-                    if self.temp_input.strip():
-                        self.submit_signal.emit()
-                    return False
-                elif event.name == 'space':
-                    self.temp_input += ' '
-                    self.text_updated.emit(self.temp_input)
-                    return False
-                elif len(event.name) == 1:
-                    is_shift = keyboard.is_pressed('shift')
-                    char = event.name.upper() if is_shift else event.name.lower()
-                    current_time = time.time()
-                    if current_time - self.last_key_time < 0.01:
-                        return False
-                    self.last_key_time = current_time
-                    self.temp_input += char
-                    self.text_updated.emit(self.temp_input)
-                    return False
+                self._shift_down.add(name)
+            else:
+                self._shift_down.discard(name)
             return False
+        if event.event_type == keyboard.KEY_DOWN:
+            self._events.append((name, bool(self._shift_down), event.time))
+            if not self._wakeup.is_set():
+                self._wakeup.set()
+        return False
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(target=self._run_worker, name="InputWorker", daemon=True)
+            self._worker.start()
+
+    def _run_worker(self):
+        events = self._events
+        while True:
+            self._wakeup.wait()
+            self._wakeup.clear()
+            while events:
+                self._process_key(*events.popleft())
+
+    def _process_key(self, name, shift, when):
+        if not self.is_active:
+            return
+        try:
+            key_name = name.lower().replace(' ', '')
+            if key_name in self.submit_hotkeys:
+                self.submit_signal.emit()
+                return
+            if name == 'enter':
+                if self.get_current_text().strip():
+                    self.submit_signal.emit()
+                return
+            with self._buffer_lock:
+                buffer = self.buffer
+                if name == 'backspace':
+                    buffer.backspace()
+                elif name == 'delete':
+                    buffer.delete()
+                elif name == 'left':
+                    buffer.move_left(shift)
+                elif name == 'right':
+                    buffer.move_right(shift)
+                elif name == 'home':
+                    buffer.move_home(shift)
+                elif name == 'end':
+                    buffer.move_end(shift)
+                elif name == 'space':
+                    buffer.insert(' ')
+                elif len(name) == 1:
+                    if when - self.last_key_time < 0.01:
+                        return
+                    self.last_key_time = when
+                    buffer.insert(name.upper() if shift else name.lower())
+                else:
+                    return
+                flush_now = self._schedule_flush()
+                self._schedule_pause()
+            if flush_now:
+                self._flush()
         except Exception as e:
             print(f"Error handling key event: {e}")
+
+    def _schedule_flush(self):
+        """Returns True if the caller should flush once it has released the lock.
+
+        Called with _buffer_lock held. The first edit after a quiet frame
+        is flushed right away, without waiting for a scheduler tick; edits
+        within the same frame ride along on a trailing flush at its end.
+        """
+        if self._flush_timer is not None or self.buffer.version == self._emitted_version:
             return False
+        deadline = self._last_flush + FRAME_INTERVAL
+        if deadline <= self._scheduler.now():
+            return True
+        self._flush_timer = self._scheduler.call_at(deadline, self._flush)
+        return False
+
+    def _schedule_pause(self):
+        # Called with _buffer_lock held; every edit pushes the pause deadline back
+        if self._pause_timer is not None:
+            self._pause_timer.cancel()
+            self._pause_timer = None
+        delay = SPECULATIVE_DELAY_MS.get() / 1000
+        self._pause_timer = self._scheduler.call_later(delay, self._on_typing_paused, self.buffer.version)
+
+    def _on_typing_paused(self, version):
+        with self._buffer_lock:
+            if version != self.buffer.version or not self.is_active:
+                return
+            self._pause_timer = None
+            text = self.buffer.text().strip()
+        if text:
+            self.typing_paused.emit(text)
+
+    def _flush(self):
+        with self._buffer_lock:
+            self._flush_timer = None
+            if self.buffer.version == self._emitted_version:
+                return
+            self._emitted_version = self.buffer.version
+            self._last_flush = self._scheduler.now()
+            text = self.buffer.text()
+            delta = None
+            if self.live_preview:
+                delta = text_delta(self._preview_text, text)
+                self._preview_text = text
+        self.text_updated.emit(text)
+        if delta is not None:
+            self.preview_delta.emit(*delta)
+
+    def _end_preview(self):
+        with self._buffer_lock:
+            had_preview = bool(self._preview_text)
+            self._preview_text = ""
+        if had_preview:
+            self.preview_delta.emit(0, "")
+
+    def _reset_buffer(self):
+        with self._buffer_lock:
+            self.buffer.clear()
+            self._emitted_version = self.buffer.version
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._pause_timer is not None:
+                self._pause_timer.cancel()
+                self._pause_timer = None
     
     def get_current_text(self):
-        return self.temp_input
+        with self._buffer_lock:
+            return self.buffer.text()
     
     def clear_text(self):
-        self.temp_input = ""
-        self.text_updated.emit(self.temp_input) 
\ No newline at end of file
+        self._reset_buffer()
+        self.text_updated.emit("")
+        self._end_preview()
@@ -0,0 +1,222 @@
+import heapq
+import itertools
+import logging
+import math
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class VirtualClock:
+    """Manually advanced clock for deterministic, faster-than-real-time runs"""
+
+    def __init__(self, start=0.0):
+        self.time = start
+
+    def __call__(self):
+        return self.time
+
+    def advance(self, seconds):
+        self.time += seconds
+
+    def advance_to(self, when):
+        self.time = max(self.time, when)
+
+
+class Timer:
+    """Handle for a callback registered with a TimerWheelScheduler"""
+    __slots__ = ('deadline', 'callback', 'args', 'rounds', 'cancelled', 'queued', '_scheduler')
+
+    def __init__(self, scheduler, deadline, callback, args):
+        self._scheduler = scheduler
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.rounds = 0
+        self.cancelled = False
+        # True while the timer sits in the wheel and counts towards pending();
+        # only changed under the scheduler's lock
+        self.queued = False
+
+    def cancel(self):
+        """Cancel the timer in O(1); the wheel drops it lazily when its slot comes up"""
+        if not self.cancelled:
+            self.cancelled = True
+            self._scheduler._discard(self)
+
+
+class TimerWheelScheduler:
+    """Drives deadline-based callbacks from a single background thread.
+
+    Timers are hashed into a fixed ring of slots by their tick number, so
+    scheduling and cancelling are O(1) and firing only touches the current
+    slot. Callbacks run on the scheduler thread and must not block.
+
+    Passing a clock (e.g. a VirtualClock) switches to manual mode: no thread
+    is started and the owner drives time with run_due() or run_until_idle().
+    """
+
+    def __init__(self, tick=0.005, slots=512, clock=None):
+        self.tick = tick
+        self.manual = clock is not None
+        self._clock = clock if clock is not None else time.monotonic
+        self._wheel = [[] for _ in range(slots)]
+        self._origin = self._clock()
+        # Manual mode only: lets run_until_idle find the next deadline quickly
+        self._deadlines = []
+        self._sequence = itertools.count()
+        self._current_tick = 0
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._thread = None
+        self._running = False
+
+    def now(self):
+        return self._clock()
+
+    def call_at(self, deadline, callback, *args):
+        """Run callback(*args) once the monotonic clock reaches deadline"""
+        timer = Timer(self, deadline, callback, args)
+        with self._cond:
+            if not self._pending:
+                # Nothing live in the wheel: jump straight to the present
+                # instead of walking every tick that passed while idle.
+                self._current_tick = self._tick_for(self.now())
+            ticks = max(math.ceil((deadline - self._origin) / self.tick), self._current_tick + 1)
+            timer.rounds = (ticks - self._current_tick - 1) // len(self._wheel)
+            self._wheel[ticks % len(self._wheel)].append(timer)
+            timer.queued = True
+            self._pending += 1
+            if self.manual:
+                heapq.heappush(self._deadlines, (deadline, next(self._sequence), timer))
+            else:
+                self._ensure_thread()
+                self._cond.notify()
+        return timer
+
+    def call_later(self, delay, callback, *args):
+        """Run callback(*args) after delay seconds"""
+        return self.call_at(self.now() + delay, callback, *args)
+
+    def pending(self):
+        return self._pending
+
+    def run_due(self):
+        """Fire every timer that is due at the clock's current time (manual mode)"""
+        return self._fire_until(self._tick_for(self.now()))
+
+    def run_until_idle(self, limit=None):
+        """Jump a VirtualClock from deadline to deadline until no timers remain.
+
+        Stops early once the next deadline is past limit (absolute clock
+        time). Returns the number of callbacks fired.
+        """
+        fired = 0
+        while self._pending:
+            with self._cond:
+                # Drop heap entries for timers that already fired or were cancelled
+                while self._deadlines and not self._deadlines[0][2].queued:
+                    heapq.heappop(self._deadlines)
+                if not self._deadlines:
+                    break
+                deadline = self._deadlines[0][0]
+            if limit is not None and deadline > limit:
+                break
+            self._clock.advance_to(deadline)
+            fired += self._fire_until(max(math.ceil((deadline - self._origin) / self.tick),
+                                          self._tick_for(self.now())))
+        return fired
+
+    def shutdown(self):
+        """Stop the scheduler thread, dropping any pending timers"""
+        with self._cond:
+            self._running = False
+            for slot in self._wheel:
+                for timer in slot:
+                    timer.queued = False
+                slot.clear()
+            self._deadlines.clear()
+            self._pending = 0
+            self._cond.notify()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join()
+        self._thread = None
+
+    def _discard(self, timer):
+        with self._cond:
+            # A timer that already fired or was dropped by shutdown() no longer counts
+            if timer.queued:
+                timer.queued = False
+                self._pending -= 1
+
+    def _tick_for(self, when):
+        return int((when - self._origin) / self.tick)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='AnimationScheduler', daemon=True)
+            self._thread.start()
+
+    def _collect_due(self, target_tick):
+        """Advance the wheel up to target_tick and return timers that are due"""
+        due = []
+        size = len(self._wheel)
+        while self._current_tick < target_tick:
+            self._current_tick += 1
+            slot = self._wheel[self._current_tick % size]
+            if not slot:
+                continue
+            keep = []
+            for timer in slot:
+                if not timer.queued:
+                    continue
+                if timer.rounds > 0:
+                    timer.rounds -= 1
+                    keep.append(timer)
+                else:
+                    timer.queued = False
+                    due.append(timer)
+            self._wheel[self._current_tick % size] = keep
+        return due
+
+    def _fire_until(self, target_tick):
+        with self._cond:
+            due = self._collect_due(target_tick)
+            self._pending -= len(due)
+        for timer in due:
+            if timer.cancelled:
+                continue
+            try:
+                timer.callback(*timer.args)
+            except Exception:
+                logger.exception("[SCHEDULER] Timer callback failed")
+        return len(due)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while self._running and not self._pending:
+                    self._cond.wait()
+                if not self._running:
+                    return
+                next_time = self._origin + (self._current_tick + 1) * self.tick
+                timeout = next_time - self.now()
+                if timeout > 0:
+                    self._cond.wait(timeout)
+                    continue
+            self._fire_until(self._tick_for(self.now()))
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """Return the process-wide animation scheduler, creating it on first use"""
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = TimerWheelScheduler()
+        return _scheduler
@@ -1,91 +1,82 @@
-from PyQt6.QtCore import QObject, QTimer, pyqtSignal
-import re
-import time
-import threading
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from mute_streamer_overload.core.chunk_layout import layout_chunks
+from mute_streamer_overload.core.fade import Fader
+from mute_streamer_overload.core.timeline import TimelinePlayer
+from mute_streamer_overload.utils.config import get_config
+
 
 class TextAnimator(QObject):
     """Class to handle additive text animation with fade-out"""
     text_updated = pyqtSignal(str)  # Signal to update the displayed text
     animation_finished = pyqtSignal()  # Signal when animation is complete
     fade_out = pyqtSignal()  # Signal to trigger fade-out in the UI
-    
-    def __init__(self, words_per_minute=200, min_chars=10, max_chars=50):
+    opacity_changed = pyqtSignal(float)  # Text opacity, stepped along the fade curves
+
+    def __init__(self, words_per_minute=200, min_chars=10, max_chars=50, scheduler=None):
         super().__init__()
         self.words_per_minute = words_per_minute
         self.min_chars = min_chars
         self.max_chars = max_chars
-        self.timer = QTimer()
-        self.interval = int((60 * 1000) / self.words_per_minute)
-        self.timer.setInterval(self.interval)
-        self.words = []
-        self.current_index = 0
         self.is_animating = False
         self.current_message = ""
-        self.animation_thread = None
-        self.stop_animation = False
-    
+        self.player = TimelinePlayer(self._layout, self.text_updated.emit,
+                                     self._on_timeline_finished, on_start=self._on_timeline_started,
+                                     scheduler=scheduler)
+        # Nothing is shown until the first message fades in
+        self.fader = Fader(self.opacity_changed.emit, opacity=0.0, scheduler=scheduler)
+        self.player.set_queue_policy(get_config("animation.queue_policy", "queue"),
+                                     get_config("animation.queue_max_depth", 5),
+                                     get_config("animation.compress_queued_hold", True))
+
     def set_character_limits(self, min_chars, max_chars):
+        """Change chunk limits, re-laying out the undisplayed part of a running animation"""
+        if (min_chars, max_chars) == (self.min_chars, self.max_chars):
+            return
         self.min_chars = min_chars
         self.max_chars = max_chars
-    
+        self.player.relayout()
+
     def start_animation(self, message):
-        if self.animation_thread and self.animation_thread.is_alive():
-            self.stop_animation = True
-            self.animation_thread.join()
-        self.current_message = message
-        self.stop_animation = False
+        """Animate message, queueing or preempting per the configured queue policy.
+
+        Never blocks: frames are driven by the shared scheduler.
+        """
+        if not message or not message.strip():
+            return
         self.is_animating = True
-        self.animation_thread = threading.Thread(target=self._animate_text)
-        self.animation_thread.daemon = True
-        self.animation_thread.start()
-    
+        self.player.submit(message)
+
     def stop_current_animation(self):
-        self.stop_animation = True
-        if self.animation_thread and self.animation_thread.is_alive():
-            self.animation_thread.join()
+        self.player.stop()
         self.is_animating = False
-    
+
     def set_words_per_minute(self, wpm):
+        """Change speed, rescheduling the remaining frames of a running animation"""
         self.words_per_minute = wpm
-        self.interval = int((60 * 1000) / self.words_per_minute)
-        self.timer.setInterval(self.interval)
-    
+        self.player.set_interval(60.0 / wpm)
+
+    def set_queue_policy(self, policy, max_depth=None, compress_hold=None):
+        self.player.set_queue_policy(policy, max_depth, compress_hold)
+
     def is_running(self):
-        return self.is_animating
-    
-    def _animate_text(self):
-        if not self.current_message:
-            return
+        return self.player.is_playing()
+
+    def _layout(self, message):
+        return layout_chunks(message, self.min_chars, self.max_chars), 60.0 / self.words_per_minute
+
+    def _on_timeline_started(self, message):
+        self.current_message = message
         print(f"[ANIMATOR] Starting animation for: '{self.current_message}'")
-        words = re.findall(r'\S+|\s+', self.current_message)
-        i = 0
-        n = len(words)
-        delay = 60.0 / self.words_per_minute
-        while i < n and not self.stop_animation:
-            # Start a new sentence
-            sentence_words = []
-            char_count = 0
-            # Build up the sentence word by word, additive
-            while i < n:
-                word = words[i]
-                # If adding this word would exceed max_chars, break
-                next_count = char_count + len(word) + (1 if sentence_words else 0)
-                if next_count > self.max_chars:
-                    break
-                if sentence_words:
-                    char_count += 1  # space
-                sentence_words.append(word.strip())
-                char_count += len(word.strip())
-                # Emit the additive build-up
-                self.text_updated.emit(' '.join(sentence_words))
-                time.sleep(delay)
-                i += 1
-            # After reaching max_chars, pause before next sentence
-            if i < n:
-                time.sleep(delay)
+        self.fader.fade_to(1.0, get_config("animation.fade_in_duration", 0.1))
+
+    def _on_timeline_finished(self):
         # Fade out at the end
-        if not self.stop_animation:
-            print(f"[ANIMATOR] Animation finished, emitting fade_out signal")
-            self.animation_finished.emit()
-            self.fade_out.emit()
-        self.is_animating = False
\ No newline at end of file
+        self.is_animating = False
+        print(f"[ANIMATOR] Animation finished, emitting fade_out signal")
+        self.animation_finished.emit()
+        self.fade_out.emit()
+        delay = get_config("animation.fade_out_delay", 1.0)
+        if delay < 0:
+            return  # Keep the last message on screen
+        self.fader.fade_to(0.0, get_config("animation.fade_out_duration", 1.0), delay=delay)
@@ -0,0 +1,295 @@
+import bisect
+import logging
+import threading
+from collections import deque
+
+from mute_streamer_overload.core.scheduler import get_scheduler
+
+logger = logging.getLogger(__name__)
+
+QUEUE_POLICIES = ("queue", "replace", "merge")
+
+
+class Timeline:
+    """Absolute frame schedule for one message.
+
+    frames is a sequence of (text, pause) pairs such as a ChunkLayout.
+    Frame i is due at start + offsets[i] * interval, where offsets are the
+    running sum of each frame's pause (in word intervals). Deadlines are
+    always derived from the start time, so per-frame work never pushes the
+    rest of the message back.
+    """
+
+    def __init__(self, frames, interval, start, hold=0.0):
+        self.frames = frames
+        # One word per frame; kept so the undisplayed tail can be re-laid out
+        self.words = getattr(frames, 'words', None)
+        self.interval = interval
+        self.start = start
+        self.hold = hold
+        self._compute_offsets()
+
+    def _compute_offsets(self):
+        self.offsets = []
+        total = 0
+        for _, pause in self.frames:
+            self.offsets.append(total)
+            total += pause
+        self.total = total
+
+    def __len__(self):
+        return len(self.frames)
+
+    def deadline(self, index):
+        return self.start + self.offsets[index] * self.interval
+
+    def finish_deadline(self):
+        return self.start + self.total * self.interval + self.hold
+
+    def retime(self, now, interval):
+        """Switch to a new interval from now on, keeping the current position.
+
+        Once every frame is due the position stops at the end, and the time
+        left in the hold is kept.
+        """
+        if interval <= 0 or self.interval <= 0:
+            self.interval = interval
+            return
+        elapsed = now - self.start
+        position = min(elapsed / self.interval, self.total)
+        held = elapsed - position * self.interval
+        self.start = now - held - position * interval
+        self.interval = interval
+
+    def splice(self, index, frames):
+        """Replace frames from index onwards, leaving the ones before it untouched.
+
+        The new frames start a fresh chunk, so the frame before index gets a
+        chunk-end pause. Existing deadlines before index are preserved.
+        """
+        head = [self.frames[i] for i in range(index)]
+        if head and len(frames):
+            head[-1] = (head[-1][0], 2)
+        words = self.words[:index] + tuple(frames.words) if self.words is not None else None
+        self.frames = head + [frames[i] for i in range(len(frames))]
+        self.words = words
+        self._compute_offsets()
+
+    def latest_due(self, now):
+        """Index of the last frame whose deadline is at or before now (-1 if none)"""
+        if self.interval <= 0:
+            return len(self.frames) - 1
+        # Small epsilon so a timer firing exactly on a deadline counts as due
+        position = (now - self.start) / self.interval + 1e-9
+        return bisect.bisect_right(self.offsets, position) - 1
+
+
+class TimelinePlayer:
+    """Plays messages as Timelines on the shared scheduler.
+
+    layout(message) turns a message into (frames, interval); submit() can
+    give a message its own interval instead. on_start(message)
+    is called when a message begins playing, on_frame(text) for each shown
+    frame and on_finished() once the queue has drained and the last hold
+    time has elapsed. When the scheduler falls behind, intermediate frames
+    are skipped so the message still ends on schedule; the lag of every
+    frame is recorded in last_lag / max_lag.
+
+    Messages submitted while another is playing are handled by the queue
+    policy: 'queue' plays them in order, 'replace' preempts the current one
+    and 'merge' folds them into a single pending message. At most max_depth
+    messages wait; the oldest is dropped beyond that.
+
+    Pass a manual-mode scheduler (see VirtualClock) to generate a message's
+    frame sequence instantly and deterministically.
+    """
+
+    def __init__(self, layout, on_frame, on_finished, on_start=None, hold=0.0, name="ANIMATOR",
+                 scheduler=None):
+        self.layout = layout
+        self.on_frame = on_frame
+        self.on_finished = on_finished
+        self.on_start = on_start
+        self.hold = hold
+        self.name = name
+        self.policy = "queue"
+        self.max_depth = 5
+        self.compress_hold = True
+        self.message = ""
+        self.timeline = None
+        self.index = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.skipped_frames = 0
+        self.dropped_messages = 0
+        self._queue = deque()
+        self._scheduler = scheduler if scheduler is not None else get_scheduler()
+        self._pending_timer = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def set_queue_policy(self, policy, max_depth=None, compress_hold=None):
+        if policy not in QUEUE_POLICIES:
+            logger.warning(f"[{self.name}] Unknown queue policy {policy!r}, using 'queue'")
+            policy = "queue"
+        with self._lock:
+            self.policy = policy
+            if max_depth is not None:
+                self.max_depth = max(1, int(max_depth))
+            if compress_hold is not None:
+                self.compress_hold = compress_hold
+            self._trim_queue()
+
+    def submit(self, message, interval=None):
+        """Play message now or queue it behind the current one, per the queue policy.
+
+        interval, if given, replaces the word interval from layout() for
+        this message only. A message that lays out to no frames (empty or
+        whitespace) is ignored.
+        """
+        frames, default_interval = self.layout(message)
+        if not len(frames):
+            logger.debug(f"[{self.name}] Ignoring empty message")
+            return
+        with self._lock:
+            if self.timeline is None or self.policy == "replace":
+                self._queue.clear()
+                self._start(message, interval, (frames, default_interval))
+                generation = self._generation
+            else:
+                if self.policy == "merge" and self._queue:
+                    queued, queued_interval = self._queue[-1]
+                    self._queue[-1] = (f"{queued} {message}", interval if interval is not None else queued_interval)
+                else:
+                    self._queue.append((message, interval))
+                    self._trim_queue()
+                logger.debug(f"[{self.name}] Queued message ({len(self._queue)} waiting)")
+                return
+        self._notify_start(message)
+        self._tick(generation)
+
+    def set_interval(self, interval):
+        """Apply a new word interval to the message that is playing right now"""
+        with self._lock:
+            if self.timeline is None:
+                return
+            self.timeline.retime(self._scheduler.now(), interval)
+            self._reschedule()
+
+    def relayout(self):
+        """Re-run layout on the words that haven't been shown yet.
+
+        Frames already on screen keep their text and timing; the remaining
+        words start a new chunk laid out with the current limits.
+        """
+        with self._lock:
+            timeline = self.timeline
+            if timeline is None or timeline.words is None or self.index >= len(timeline):
+                return
+            frames, _ = self.layout(' '.join(timeline.words[self.index:]))
+            timeline.splice(self.index, frames)
+            self._reschedule()
+
+    def stop(self):
+        """Stop playback and drop anything queued"""
+        with self._lock:
+            self._cancel_pending()
+            self._queue.clear()
+            self.timeline = None
+
+    def is_playing(self):
+        return self.timeline is not None
+
+    def backlog(self):
+        return len(self._queue)
+
+    def _trim_queue(self):
+        while len(self._queue) > self.max_depth:
+            dropped, _ = self._queue.popleft()
+            self.dropped_messages += 1
+            logger.warning(f"[{self.name}] Queue full, dropping oldest message: {dropped!r}")
+
+    def _current_hold(self):
+        # Each waiting message shortens the hold so a backlog drains faster
+        if self.compress_hold and self._queue:
+            return self.hold / (1 + len(self._queue))
+        return self.hold
+
+    def _start(self, message, interval=None, layout=None):
+        self._cancel_pending()
+        frames, default_interval = layout if layout is not None else self.layout(message)
+        if interval is None:
+            interval = default_interval
+        self.message = message
+        self.timeline = Timeline(frames, interval, self._scheduler.now(), self.hold)
+        self.index = 0
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.skipped_frames = 0
+
+    def _reschedule(self):
+        """Move the pending tick to the (possibly changed) deadline of the next frame"""
+        if self._pending_timer is None:
+            return
+        self._pending_timer.cancel()
+        timeline = self.timeline
+        if self.index < len(timeline):
+            deadline = timeline.deadline(self.index)
+        else:
+            deadline = timeline.finish_deadline()
+        self._pending_timer = self._scheduler.call_at(deadline, self._tick, self._generation)
+
+    def _notify_start(self, message):
+        if self.on_start:
+            self.on_start(message)
+
+    def _cancel_pending(self):
+        # Bumping the generation retires a tick that is already running on
+        # the scheduler thread and so can no longer be cancelled.
+        self._generation += 1
+        if self._pending_timer is not None:
+            self._pending_timer.cancel()
+            self._pending_timer = None
+
+    def _tick(self, generation):
+        # Callbacks run after the lock is released, so they may call back
+        # into the player (submit, set_interval, stop) without deadlocking
+        with self._lock:
+            if generation != self._generation or self.timeline is None:
+                return
+            timeline = self.timeline
+            if self.index < len(timeline):
+                now = self._scheduler.now()
+                due = max(timeline.latest_due(now), self.index)
+                self.last_lag = max(0.0, now - timeline.deadline(self.index))
+                self.max_lag = max(self.max_lag, self.last_lag)
+                self.skipped_frames += due - self.index
+                text = timeline.frames[due][0]
+                self.index = due + 1
+                if self.index < len(timeline):
+                    self._pending_timer = self._scheduler.call_at(
+                        timeline.deadline(self.index), self._tick, generation)
+                else:
+                    timeline.hold = self._current_hold()
+                    self._pending_timer = self._scheduler.call_at(
+                        timeline.finish_deadline(), self._tick, generation)
+                message = None
+            else:
+                text = None
+                logger.debug(f"[{self.name}] Timeline done: max lag {self.max_lag * 1000:.1f} ms, "
+                             f"{self.skipped_frames} frame(s) skipped")
+                if self._queue:
+                    message, interval = self._queue.popleft()
+                    self._start(message, interval)
+                    generation = self._generation
+                else:
+                    self._pending_timer = None
+                    self.timeline = None
+                    message = None
+        if text is not None:
+            self.on_frame(text)
+        elif message is None:
+            self.on_finished()
+        else:
+            self._notify_start(message)
+            self._tick(generation)
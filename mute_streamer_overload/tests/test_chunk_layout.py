@@ -0,0 +1,43 @@
+import pytest
+
+from mute_streamer_overload.core.chunk_layout import layout_chunks
+
+
+def frames(layout):
+    return [layout[i] for i in range(len(layout))]
+
+
+@pytest.mark.parametrize('message', ['', ' ', '  \t\n '])
+def test_blank_message_has_no_frames(message):
+    layout = layout_chunks(message, 10, 50)
+    assert len(layout) == 0
+    assert layout.chunks == ()
+
+
+def test_single_chunk_frames_grow_word_by_word():
+    layout = layout_chunks('hello there  world', 1, 50)
+    assert frames(layout) == [('hello', 1), ('hello there', 1), ('hello there world', 1)]
+
+
+def test_chunks_break_at_max_chars():
+    layout = layout_chunks('aaaa bbbb cccc dddd', 1, 9)
+    assert layout.chunk_texts == ('aaaa bbbb', 'cccc dddd')
+    # The last frame of a chunk followed by another one pauses twice as long
+    assert frames(layout) == [('aaaa', 1), ('aaaa bbbb', 2), ('cccc', 1), ('cccc dddd', 1)]
+    assert [layout.chunk_of(i) for i in range(4)] == [0, 0, 1, 1]
+
+
+def test_word_longer_than_max_chars_gets_its_own_chunk():
+    layout = layout_chunks('a extraordinarily b', 1, 5)
+    assert layout.chunk_texts == ('a', 'extraordinarily', 'b')
+
+
+def test_short_tail_borrows_from_previous_chunk():
+    layout = layout_chunks('one two three four five six x', 8, 24)
+    assert layout.chunk_texts == ('one two three four', 'five six x')
+    assert all(len(text) <= 24 for text in layout.chunk_texts)
+
+
+def test_layout_is_cached_per_message_and_limits():
+    assert layout_chunks('same words', 10, 50) is layout_chunks('same words', 10, 50)
+    assert layout_chunks('same words', 10, 50) is not layout_chunks('same words', 5, 50)
@@ -0,0 +1,187 @@
+import json
+import time
+
+import pytest
+
+from mute_streamer_overload.utils import config as config_module
+from mute_streamer_overload.utils.config import ConfigManager
+from mute_streamer_overload.utils.config_schema import validate
+
+
+@pytest.fixture
+def config_path(tmp_path, monkeypatch):
+    path = tmp_path / 'profile.json'
+    monkeypatch.setattr(ConfigManager, '_get_config_path', lambda self: path)
+    return path
+
+
+@pytest.fixture
+def manager(config_path):
+    manager = ConfigManager()
+    manager.set('general.auto_save_config', False)
+    yield manager
+    manager.stop_watching()
+
+
+def read(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write(path, config):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+
+
+def test_defaults_are_saved_on_first_start(config_path):
+    manager = ConfigManager()
+    assert config_path.exists()
+    assert read(config_path)['animation']['words_per_minute'] == manager.get('animation.words_per_minute')
+
+
+def test_transaction_saves_once_at_the_end(manager, config_path):
+    manager.set('general.auto_save_config', True)
+    manager.save_config()
+    with manager.transaction():
+        manager.set('tts.speed', 1.5)
+        manager.save_config()
+        manager.set('tts.pitch', 1.2)
+        assert read(config_path)['tts']['speed'] == 1.0
+    manager.flush()
+    saved = read(config_path)['tts']
+    assert (saved['speed'], saved['pitch']) == (1.5, 1.2)
+
+
+def test_burst_of_changes_is_written_once_it_goes_quiet(manager, config_path, monkeypatch):
+    writes = []
+    write_atomic = config_module._write_atomic
+    monkeypatch.setattr(config_module, 'SAVE_DELAY', 0.05)
+    monkeypatch.setattr(config_module, '_write_atomic', lambda path, text: (writes.append(text),
+                                                                           write_atomic(path, text)))
+    manager.set('general.auto_save_config', True)
+    for speed in (1.1, 1.2, 1.3, 1.4):
+        manager.set('tts.speed', speed)
+        time.sleep(0.02)
+    assert writes == []
+    time.sleep(0.3)
+    assert len(writes) == 1
+    assert read(config_path)['tts']['speed'] == 1.4
+
+
+def test_on_change_reports_changed_keys_only(manager):
+    changes = []
+    unsubscribe = manager.on_change('tts.*', lambda key, value: changes.append((key, value)))
+    manager.set('tts.speed', 1.5)
+    manager.set('tts.speed', 1.5)
+    manager.set('animation.words_per_minute', 300)
+    unsubscribe()
+    manager.set('tts.speed', 2.0)
+    assert changes == [('tts.speed', 1.5)]
+
+
+def test_config_key_follows_changes(manager):
+    key = manager.key('tts.speed', 1.0)
+    assert key.get() == 1.0
+    manager.set('tts.speed', 1.25)
+    assert key.get() == 1.25
+    key.set(0.75)
+    assert manager.get('tts.speed') == 0.75
+
+
+def test_reset_notifies_changed_keys(manager):
+    manager.set('tts.speed', 1.5)
+    changes = []
+    manager.on_change('*', lambda key, value: changes.append(key))
+    manager.reset_to_defaults()
+    # The fixture turned auto-save off; the reset turns it back on
+    assert sorted(changes) == ['general.auto_save_config', 'tts.speed']
+
+
+def test_reset_reports_removed_keys_with_none(manager):
+    manager.set('plugins.extra', 1)
+    changes = []
+    manager.on_change('plugins.*', lambda key, value: changes.append((key, value)))
+    manager.reset_to_defaults()
+    assert changes == [('plugins.extra', None)]
+
+
+def test_reload_applies_only_external_edits(manager, config_path):
+    manager.save_config()
+    manager.set('tts.pitch', 1.3)  # unsaved
+    config = read(config_path)
+    config['tts']['speed'] = 1.75
+    config['animation']['words_per_minute'] = 'not a number'
+    write(config_path, config)
+
+    assert manager.reload_from_disk() == ['tts.speed']
+    assert manager.get('tts.speed') == 1.75
+    assert manager.get('tts.pitch') == 1.3
+    assert manager.get('animation.words_per_minute') == 500
+    # Unchanged file: nothing to apply
+    assert manager.reload_from_disk() == []
+
+
+def test_reload_ignores_invalid_json(manager, config_path):
+    config_path.write_text('{"tts": ', encoding='utf-8')
+    assert manager.reload_from_disk() == []
+
+
+def test_validate_reports_wrong_types():
+    errors = validate({'tts.speed': 'x', 'ui.window_x': None, 'twitch.send_timing': 'later',
+                       'overlay.start_visible': 1, 'unknown.key': object()})
+    assert set(errors) == {'tts.speed', 'twitch.send_timing', 'overlay.start_visible'}
+    assert "'immediate', 'after_animation'" in errors['twitch.send_timing']
+
+
+def test_invalid_values_in_file_fall_back_to_defaults(config_path):
+    write(config_path, {'animation': {'words_per_minute': 'fast', 'queue_policy': 'qeue', 'max_characters': 40}})
+    manager = ConfigManager()
+    snapshot = manager.snapshot()
+    assert snapshot.animation.words_per_minute == 500
+    assert snapshot.animation.queue_policy == 'queue'
+    assert snapshot.animation.max_characters == 40
+
+
+def test_import_drops_invalid_values(manager, tmp_path):
+    imported = tmp_path / 'imported.json'
+    write(imported, {'animation': {'words_per_minute': 'fast', 'max_characters': 40}})
+    manager.import_config(imported)
+    assert manager.get('animation.words_per_minute') == 500
+    assert manager.get('animation.max_characters') == 40
+    assert manager.snapshot().animation.max_characters == 40
+
+
+def test_switch_profile_applies_differences(manager):
+    manager.set('animation.words_per_minute', 300)
+    manager.save_profile('Gaming')
+    manager.set('animation.words_per_minute', 150)
+    manager.set('tts.speed', 1.5)
+
+    assert manager.switch_profile('Gaming') == ['animation.words_per_minute', 'tts.speed']
+    assert manager.active_profile() == 'Gaming'
+    assert manager.get('animation.words_per_minute') == 300
+
+    # Edits made under the profile that was left are kept in it
+    manager.switch_profile('Default')
+    assert manager.get('animation.words_per_minute') == 150
+    assert manager.list_profiles() == ['Default', 'Gaming']
+
+
+def test_switch_to_unknown_profile_raises(manager):
+    with pytest.raises(KeyError):
+        manager.switch_profile('Missing')
+
+
+def test_active_profile_cannot_be_deleted(manager):
+    with pytest.raises(ValueError):
+        manager.delete_profile(manager.active_profile())
+
+
+def test_profile_names_with_dots_survive_reload(manager, config_path):
+    manager.set('tts.speed', 1.25)
+    manager.save_profile('Stream v1.2')
+    manager.save_config()
+
+    reloaded = ConfigManager()
+    assert 'Stream v1.2' in reloaded.list_profiles()
+    assert reloaded.config['profiles']['Stream v1.2']['tts']['speed'] == 1.25
@@ -0,0 +1,97 @@
+from mute_streamer_overload.core.input_buffer import InputBuffer, text_delta
+
+
+def typed(text):
+    buffer = InputBuffer()
+    buffer.insert(text)
+    return buffer
+
+
+def test_insert_and_backspace():
+    buffer = typed('hello')
+    assert buffer.text() == 'hello'
+    assert buffer.cursor == 5
+    buffer.backspace()
+    assert buffer.text() == 'hell'
+
+
+def test_insert_in_the_middle():
+    buffer = typed('helo')
+    buffer.move_left()
+    buffer.insert('l')
+    assert buffer.text() == 'hello'
+    assert buffer.cursor == 4
+
+
+def test_delete_removes_character_after_cursor():
+    buffer = typed('abc')
+    buffer.move_home()
+    buffer.delete()
+    assert buffer.text() == 'bc'
+    assert buffer.cursor == 0
+
+
+def test_edits_at_the_ends_are_no_ops():
+    buffer = InputBuffer()
+    version = buffer.version
+    buffer.backspace()
+    buffer.delete()
+    buffer.move_left()
+    buffer.move_right()
+    assert buffer.text() == ''
+    assert buffer.version == version
+
+
+def test_move_to_clamps_position():
+    buffer = typed('abc')
+    buffer.move_to(-5)
+    assert buffer.cursor == 0
+    buffer.move_to(99)
+    assert buffer.cursor == 3
+
+
+def test_typing_replaces_selection():
+    buffer = typed('hello world')
+    buffer.move_to(6)
+    buffer.move_end(select=True)
+    assert buffer.selection() == (6, 11)
+    buffer.insert('there')
+    assert buffer.text() == 'hello there'
+    assert buffer.selection() is None
+
+
+def test_backspace_deletes_selection_right_of_cursor():
+    buffer = typed('abcdef')
+    buffer.move_to(4)
+    buffer.move_to(1, select=True)
+    assert buffer.selection() == (1, 4)
+    buffer.backspace()
+    assert buffer.text() == 'aef'
+    assert buffer.cursor == 1
+
+
+def test_select_all_and_delete():
+    buffer = typed('everything')
+    buffer.select_all()
+    buffer.delete()
+    assert buffer.text() == ''
+    assert len(buffer) == 0
+
+
+def test_version_changes_with_every_edit():
+    buffer = typed('ab')
+    version = buffer.version
+    buffer.move_left()
+    assert buffer.version == version
+    buffer.insert('x')
+    assert buffer.version == version + 1
+    buffer.clear()
+    assert buffer.text() == ''
+    assert buffer.version == version + 2
+
+
+def test_text_delta():
+    assert text_delta('hello', 'hello world') == (5, ' world')
+    assert text_delta('hello world', 'hello') == (5, '')
+    assert text_delta('hello', 'help') == (3, 'p')
+    assert text_delta('', '') == (0, '')
@@ -0,0 +1,39 @@
+from mute_streamer_overload.core.input_handler import FRAME_INTERVAL, InputHandler
+from mute_streamer_overload.core.scheduler import TimerWheelScheduler, VirtualClock
+
+
+def make_handler():
+    clock = VirtualClock(start=100.0)
+    scheduler = TimerWheelScheduler(clock=clock)
+    handler = InputHandler(scheduler=scheduler)
+    handler.is_active = True
+    updates = []
+    handler.text_updated.connect(updates.append)
+    return clock, scheduler, handler, updates
+
+
+def type_keys(handler, text, when=1.0):
+    for i, char in enumerate(text):
+        # Key times 20 ms apart stay clear of the per-key debounce
+        handler._process_key('space' if char == ' ' else char, False, when + i * 0.02)
+
+
+def test_first_edit_after_a_quiet_frame_is_flushed_immediately():
+    clock, scheduler, handler, updates = make_handler()
+    type_keys(handler, 'h')
+    assert updates == ['h']
+    assert scheduler.pending() == 1  # only the typing-pause timer
+
+
+def test_edits_within_a_frame_are_coalesced():
+    clock, scheduler, handler, updates = make_handler()
+    type_keys(handler, 'hey')
+    assert updates == ['h']
+    # The trailing flush is due one frame later, rounded up to the wheel's tick
+    clock.advance(FRAME_INTERVAL + scheduler.tick)
+    scheduler.run_due()
+    assert updates == ['h', 'hey']
+
+    clock.advance(1.0)
+    type_keys(handler, '!', when=2.0)
+    assert updates == ['h', 'hey', 'hey!']
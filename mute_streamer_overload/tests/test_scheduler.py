@@ -0,0 +1,104 @@
+from mute_streamer_overload.core.scheduler import TimerWheelScheduler, VirtualClock
+
+
+def make_scheduler():
+    clock = VirtualClock()
+    return clock, TimerWheelScheduler(clock=clock)
+
+
+def test_timers_fire_in_deadline_order():
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.call_at(0.3, fired.append, 'c')
+    scheduler.call_at(0.1, fired.append, 'a')
+    scheduler.call_later(0.2, fired.append, 'b')
+    assert scheduler.pending() == 3
+
+    assert scheduler.run_until_idle() == 3
+    assert fired == ['a', 'b', 'c']
+    assert scheduler.pending() == 0
+    assert clock() == 0.3
+
+
+def test_run_due_only_fires_due_timers():
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.call_at(0.1, fired.append, 'early')
+    scheduler.call_at(10.0, fired.append, 'late')
+
+    clock.advance(0.5)
+    scheduler.run_due()
+    assert fired == ['early']
+    assert scheduler.pending() == 1
+
+
+def test_run_until_idle_stops_at_limit():
+    clock, scheduler = make_scheduler()
+    fired = []
+    scheduler.call_at(1.0, fired.append, 1)
+    scheduler.call_at(5.0, fired.append, 5)
+
+    scheduler.run_until_idle(limit=2.0)
+    assert fired == [1]
+    assert scheduler.pending() == 1
+
+
+def test_timers_beyond_one_wheel_revolution():
+    clock, scheduler = make_scheduler()
+    fired = []
+    # 512 slots of 5 ms: these wrap around the wheel several times
+    scheduler.call_at(7.0, fired.append, 'far')
+    scheduler.call_at(2.6, fired.append, 'near')
+    scheduler.run_until_idle()
+    assert fired == ['near', 'far']
+
+
+def test_callback_can_schedule_another_timer():
+    clock, scheduler = make_scheduler()
+    fired = []
+
+    def chain(n):
+        fired.append(n)
+        if n < 3:
+            scheduler.call_later(0.1, chain, n + 1)
+
+    scheduler.call_at(0.1, chain, 0)
+    scheduler.run_until_idle()
+    assert fired == [0, 1, 2, 3]
+
+
+def test_cancel_prevents_firing():
+    clock, scheduler = make_scheduler()
+    fired = []
+    timer = scheduler.call_at(0.1, fired.append, 'cancelled')
+    scheduler.call_at(0.2, fired.append, 'kept')
+
+    timer.cancel()
+    assert scheduler.pending() == 1
+    scheduler.run_until_idle()
+    assert fired == ['kept']
+
+
+def test_cancel_after_firing_keeps_pending_count():
+    clock, scheduler = make_scheduler()
+    timer = scheduler.call_at(0.1, lambda: None)
+    scheduler.run_until_idle()
+
+    timer.cancel()
+    timer.cancel()
+    assert scheduler.pending() == 0
+
+
+def test_shutdown_drops_pending_timers():
+    clock, scheduler = make_scheduler()
+    fired = []
+    timer = scheduler.call_at(0.1, fired.append, 'dropped')
+    scheduler.call_at(0.2, fired.append, 'dropped')
+
+    scheduler.shutdown()
+    assert scheduler.pending() == 0
+    timer.cancel()
+    assert scheduler.pending() == 0
+    clock.advance(1.0)
+    scheduler.run_due()
+    assert fired == []
@@ -0,0 +1,182 @@
+import pytest
+
+from mute_streamer_overload.core.chunk_layout import layout_chunks
+from mute_streamer_overload.core.scheduler import TimerWheelScheduler, VirtualClock
+from mute_streamer_overload.core.timeline import Timeline, TimelinePlayer
+
+
+def make_timeline(hold=1.0):
+    # Frames due at 0, 0.5, 1.0; the last pause ends at 2.0, the hold at 3.0
+    return Timeline([('a', 1), ('a b', 1), ('a b c', 2)], 0.5, 0.0, hold=hold)
+
+
+def test_deadlines_follow_pauses():
+    timeline = make_timeline()
+    assert [timeline.deadline(i) for i in range(3)] == [0.0, 0.5, 1.0]
+    assert timeline.finish_deadline() == 3.0
+    assert timeline.latest_due(0.6) == 1
+    assert timeline.latest_due(1.0) == 2
+
+
+class Recorder:
+    def __init__(self, interval=0.5, **kwargs):
+        self.clock = VirtualClock()
+        self.scheduler = TimerWheelScheduler(clock=self.clock)
+        self.frames = []
+        self.finished = 0
+        self.player = TimelinePlayer(lambda message: (layout_chunks(message, 1, 50), interval),
+                                     self.on_frame, self.on_finished, hold=1.0, scheduler=self.scheduler,
+                                     **kwargs)
+
+    def on_frame(self, text):
+        self.frames.append((round(self.clock(), 3), text))
+
+    def on_finished(self):
+        self.finished += 1
+
+    def run(self):
+        self.scheduler.run_until_idle()
+
+
+def test_player_plays_frames_on_schedule():
+    recorder = Recorder()
+    recorder.player.submit('one two three')
+    recorder.run()
+    assert recorder.frames == [(0.0, 'one'), (0.5, 'one two'), (1.0, 'one two three')]
+    assert recorder.finished == 1
+    assert not recorder.player.is_playing()
+
+
+def test_late_ticks_skip_frames_but_keep_the_end_time():
+    recorder = Recorder()
+    recorder.player.submit('one two three four')
+    # A scheduler that falls behind by 1.2 s shows the frame that is due by then
+    recorder.clock.advance(1.2)
+    recorder.scheduler.run_due()
+    recorder.run()
+    assert [text for _, text in recorder.frames] == ['one', 'one two three', 'one two three four']
+    assert recorder.frames[-1][0] == 1.5
+    assert recorder.player.skipped_frames == 1
+
+
+def texts(recorder):
+    return [text for _, text in recorder.frames]
+
+
+def test_player_queues_messages_in_order():
+    recorder = Recorder()
+    recorder.player.submit('one two')
+    recorder.player.submit('three')
+    recorder.player.submit('four')
+    assert recorder.player.backlog() == 2
+    recorder.run()
+    assert texts(recorder) == ['one', 'one two', 'three', 'four']
+    assert recorder.finished == 1
+
+
+def test_player_merge_policy_combines_waiting_messages():
+    recorder = Recorder()
+    recorder.player.set_queue_policy('merge')
+    recorder.player.submit('one')
+    recorder.player.submit('two')
+    recorder.player.submit('three')
+    assert recorder.player.backlog() == 1
+    recorder.run()
+    assert texts(recorder) == ['one', 'two', 'two three']
+
+
+def test_player_replace_policy_preempts():
+    recorder = Recorder()
+    recorder.player.set_queue_policy('replace')
+    recorder.player.submit('one two three')
+    recorder.player.submit('four')
+    recorder.run()
+    assert texts(recorder) == ['one', 'four']
+
+
+def test_player_drops_oldest_beyond_max_depth():
+    recorder = Recorder()
+    recorder.player.set_queue_policy('queue', max_depth=1)
+    recorder.player.submit('one')
+    recorder.player.submit('two')
+    recorder.player.submit('three')
+    recorder.run()
+    assert texts(recorder) == ['one', 'three']
+    assert recorder.player.dropped_messages == 1
+
+
+def test_unknown_queue_policy_falls_back_to_queue():
+    recorder = Recorder()
+    recorder.player.set_queue_policy('qeue')
+    assert recorder.player.policy == 'queue'
+
+
+def test_player_ignores_blank_messages():
+    recorder = Recorder()
+    recorder.player.submit('   ')
+    recorder.run()
+    assert recorder.frames == []
+    assert not recorder.player.is_playing()
+
+
+def test_retime_keeps_current_position():
+    timeline = make_timeline()
+    timeline.retime(0.75, 0.25)
+    # Halfway between frames 1 and 2 before and after the change
+    assert timeline.deadline(2) == pytest.approx(0.875)
+    assert timeline.latest_due(0.8) == 1
+    assert timeline.finish_deadline() == pytest.approx(2.375)
+
+
+def test_retime_during_hold_keeps_finish_deadline():
+    timeline = make_timeline()
+    timeline.retime(2.5, 0.1)
+    assert timeline.finish_deadline() == pytest.approx(3.0)
+    assert timeline.latest_due(2.5) == 2
+
+
+def test_splice_replaces_the_tail():
+    layout = layout_chunks('one two three four', 1, 50)
+    timeline = Timeline(layout, 0.5, 0.0)
+    timeline.splice(2, layout_chunks('three four', 1, 50))
+    assert [timeline.frames[i][0] for i in range(len(timeline))] == ['one', 'one two', 'three', 'three four']
+    # The frame before the splice ends a chunk now
+    assert timeline.offsets == [0, 1, 3, 4]
+    assert timeline.words == ('one', 'two', 'three', 'four')
+
+
+def test_set_interval_speeds_up_the_rest_of_the_message():
+    recorder = Recorder()
+    recorder.player.submit('one two three')
+    recorder.clock.advance(0.5)
+    recorder.scheduler.run_due()
+    recorder.player.set_interval(0.1)
+    recorder.run()
+    assert recorder.frames == [(0.0, 'one'), (0.5, 'one two'), (0.6, 'one two three')]
+
+
+def test_player_queues_messages_with_their_own_interval():
+    recorder = Recorder()
+    recorder.player.submit('one two')
+    recorder.player.submit('three four', interval=0.1)
+    recorder.run()
+    assert texts(recorder) == ['one', 'one two', 'three', 'three four']
+    (start, _), (second, _) = recorder.frames[2:]
+    assert second - start == pytest.approx(0.1)
+
+
+def test_frame_callback_can_call_back_into_the_player():
+    recorder = Recorder()
+    player = recorder.player
+
+    def on_frame(text):
+        recorder.on_frame(text)
+        if text == 'one two':
+            player.stop()
+            player.submit('three')
+
+    player.on_frame = on_frame
+    player.submit('one two')
+    recorder.run()
+    assert texts(recorder) == ['one', 'one two', 'three']
+    assert recorder.finished == 1
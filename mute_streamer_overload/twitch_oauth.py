@@ -3,12 +3,12 @@ import webbrowser
 import threading
 import http.server
 import urllib.parse
-import requests
 import json
 import time
 import logging
 import socket
-from mute_streamer_overload.utils.config import get_config, set_config, save_config
+from mute_streamer_overload.utils.config import get_config, set_config, save_config, update_config, on_change
+from mute_streamer_overload.utils import http_client
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,64 @@ REDIRECT_URI = f"http://localhost:{OAUTH_PORT}/twitch_oauth_callback"
 
 logger.info(f"Using OAuth port: {OAUTH_PORT}")
 
+# The logged-in user's (access_token, user_id, login), so chat sends don't
+# have to look the user up first. Persisted as twitch.user_id.
+_identity = None
+_identity_lock = threading.Lock()
+
+
+def _remember_identity(access_token, user_id, login):
+    global _identity
+    with _identity_lock:
+        _identity = (access_token, user_id, login)
+
+
+def invalidate_twitch_identity():
+    """Forget the cached user ID; the next chat send looks it up again."""
+    global _identity
+    with _identity_lock:
+        _identity = None
+    set_config('twitch.user_id', None)
+
+
+def get_twitch_identity(access_token, headers):
+    """Return (user_id, login) for access_token, asking Twitch only when it isn't cached."""
+    with _identity_lock:
+        if _identity is not None and _identity[0] == access_token:
+            return _identity[1], _identity[2]
+    user_id = get_config('twitch.user_id')
+    username = get_config('twitch.username')
+    if user_id and username and get_config('twitch.access_token') == access_token:
+        _remember_identity(access_token, user_id, username)
+        return user_id, username
+    
+    resp = http_client.get('https://api.twitch.tv/helix/users', headers=headers)
+    if not resp.ok:
+        logger.error(f"Failed to get user info: {resp.status_code}")
+        return None
+    data = resp.json()
+    if not data.get('data'):
+        logger.error("No user data received")
+        return None
+    user_info = data['data'][0]
+    _remember_identity(access_token, user_info['id'], user_info['login'])
+    set_config('twitch.user_id', user_info['id'])
+    return user_info['id'], user_info['login']
+
+
+def _on_access_token_changed(key, value):
+    # A different token may belong to a different account, so neither the
+    # cached nor the persisted user ID can be trusted for it
+    global _identity
+    with _identity_lock:
+        if _identity is not None and _identity[0] != value:
+            _identity = None
+    if get_config('twitch.user_id') is not None:
+        set_config('twitch.user_id', None)
+
+
+on_change('twitch.access_token', _on_access_token_changed)
+
 class OAuthHandler(http.server.BaseHTTPRequestHandler):
     def log_message(self, format, *args):
         """Override to use our logger instead of stderr."""
@@ -153,7 +211,7 @@ class OAuthHandler(http.server.BaseHTTPRequestHandler):
                             'Authorization': f'Bearer {access_token}',
                             'Client-Id': CLIENT_ID
                         }
-                        resp = requests.get('https://api.twitch.tv/helix/users', headers=headers)
+                        resp = http_client.get('https://api.twitch.tv/helix/users', headers=headers)
                         
                         if resp.ok:
                             data = resp.json()
@@ -162,12 +220,17 @@ class OAuthHandler(http.server.BaseHTTPRequestHandler):
                                 username = user_info['login']
                                 display_name = user_info['display_name']
                                 
-                                # Save to config
-                                set_config('twitch.access_token', access_token)
-                                set_config('twitch.username', username)
-                                set_config('twitch.display_name', display_name)
-                                set_config('twitch.client_id', CLIENT_ID)
+                                # Save to config; user_id goes after access_token,
+                                # whose change clears the stored user_id
+                                update_config({
+                                    'twitch.access_token': access_token,
+                                    'twitch.username': username,
+                                    'twitch.display_name': display_name,
+                                    'twitch.user_id': user_info['id'],
+                                    'twitch.client_id': CLIENT_ID
+                                })
                                 save_config()
+                                _remember_identity(access_token, user_info['id'], username)
                                 
                                 logger.info(f"Successfully authenticated as {display_name} ({username})")
                             else:
@@ -269,25 +332,16 @@ def send_message_to_twitch_chat(message):
         return False
     
     try:
-        # Get user info (this includes the user's channel ID)
         headers = {
             'Authorization': f'Bearer {access_token}',
             'Client-Id': CLIENT_ID
         }
         
-        resp = requests.get('https://api.twitch.tv/helix/users', headers=headers)
-        if not resp.ok:
-            logger.error(f"Failed to get user info: {resp.status_code}")
+        # The user's own ID doubles as the channel ID; cached after the first lookup
+        identity = get_twitch_identity(access_token, headers)
+        if identity is None:
             return False
-            
-        data = resp.json()
-        if not data.get('data'):
-            logger.error("No user data received")
-            return False
-            
-        user_info = data['data'][0]
-        user_id = user_info['id']
-        user_login = user_info['login']
+        user_id, user_login = identity
         
         # Send message to the user's own channel
         chat_url = 'https://api.twitch.tv/helix/chat/messages'
@@ -297,7 +351,7 @@ def send_message_to_twitch_chat(message):
             'message': message
         }
         
-        resp = requests.post(chat_url, headers=headers, json=payload)
+        resp = http_client.post(chat_url, headers=headers, json=payload)
         
         if resp.ok:
             logger.info(f"Message sent to Twitch chat in #{user_login}: {message}")
@@ -305,7 +359,10 @@ def send_message_to_twitch_chat(message):
         else:
             logger.error(f"Failed to send message: {resp.status_code} - {resp.text}")
             # Log more details for debugging
-            if resp.status_code == 403:
+            if resp.status_code == 401:
+                logger.error("Twitch rejected the access token. Please log in again.")
+                invalidate_twitch_identity()
+            elif resp.status_code == 403:
                 logger.error("Access denied. Make sure you have the 'chat:edit' scope.")
             elif resp.status_code == 400:
                 logger.error("Bad request. Check if the message format is valid.")
@@ -331,8 +388,11 @@ def get_twitch_user_info():
 
 def logout_twitch():
     """Clear Twitch authentication data."""
-    set_config('twitch.access_token', None)
-    set_config('twitch.username', None)
-    set_config('twitch.display_name', None)
+    update_config({
+        'twitch.access_token': None,
+        'twitch.username': None,
+        'twitch.display_name': None
+    })
+    invalidate_twitch_identity()
     save_config()
     logger.info("Twitch authentication cleared") 
\ No newline at end of file
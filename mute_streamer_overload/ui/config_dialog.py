@@ -7,7 +7,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QTabWidget,
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QIcon
 
-from mute_streamer_overload.utils.config import get_config, set_config, save_config, reset_config
+from mute_streamer_overload.utils.config import get_config, set_config, save_config, reset_config, config_transaction
 from mute_streamer_overload.utils.styles import get_stylesheet
 from mute_streamer_overload.utils.azure_voices import azure_voices
 
@@ -181,6 +181,27 @@ class ConfigDialog(QDialog):
         limits_layout.addWidget(self.max_chars_spin, 1, 1)
         
         layout.addWidget(limits_group)
+        
+        # Message queue
+        queue_group = QGroupBox("Message Queue")
+        queue_layout = QGridLayout(queue_group)
+        
+        self.queue_policy_combo = QComboBox()
+        self.queue_policy_combo.addItem("Queue (play in order)", "queue")
+        self.queue_policy_combo.addItem("Replace (interrupt current)", "replace")
+        self.queue_policy_combo.addItem("Merge (combine waiting messages)", "merge")
+        queue_layout.addWidget(QLabel("When a message arrives mid-animation:"), 0, 0)
+        queue_layout.addWidget(self.queue_policy_combo, 0, 1)
+        
+        self.queue_depth_spin = QSpinBox()
+        self.queue_depth_spin.setRange(1, 50)
+        queue_layout.addWidget(QLabel("Maximum Waiting Messages:"), 1, 0)
+        queue_layout.addWidget(self.queue_depth_spin, 1, 1)
+        
+        self.compress_hold_check = QCheckBox("Shorten hold time while messages are waiting")
+        queue_layout.addWidget(self.compress_hold_check, 2, 0, 1, 2)
+        
+        layout.addWidget(queue_group)
         layout.addStretch()
         return widget
     
@@ -266,6 +287,15 @@ class ConfigDialog(QDialog):
         hotkey_layout.addWidget(self.submit_hotkey_edit)
         
         layout.addWidget(hotkey_group)
+        
+        # Live preview settings
+        preview_group = QGroupBox("Live Preview")
+        preview_layout = QVBoxLayout(preview_group)
+        
+        self.live_preview_check = QCheckBox("Show text on the overlays while typing")
+        preview_layout.addWidget(self.live_preview_check)
+        
+        layout.addWidget(preview_group)
         layout.addStretch()
         return widget
     
@@ -281,6 +311,9 @@ class ConfigDialog(QDialog):
         self.auto_save_check = QCheckBox("Auto-save configuration")
         general_layout.addWidget(self.auto_save_check)
         
+        self.watch_config_check = QCheckBox("Reload settings when the config file is edited")
+        general_layout.addWidget(self.watch_config_check)
+        
         self.check_updates_check = QCheckBox("Check for updates")
         general_layout.addWidget(self.check_updates_check)
         
@@ -661,6 +694,10 @@ class ConfigDialog(QDialog):
         self.min_chars_spin.setValue(get_config("animation.min_characters", 10))
         self.max_chars_spin.setValue(get_config("animation.max_characters", 50))
         self.animation_delay_spin.setValue(get_config("animation.animation_delay_ms", 100))
+        idx = self.queue_policy_combo.findData(get_config("animation.queue_policy", "queue"))
+        self.queue_policy_combo.setCurrentIndex(idx if idx != -1 else 0)
+        self.queue_depth_spin.setValue(get_config("animation.queue_max_depth", 5))
+        self.compress_hold_check.setChecked(get_config("animation.compress_queued_hold", True))
         
         # Web server settings
         self.host_edit.setText(get_config("web_server.host", "127.0.0.1"))
@@ -681,9 +718,11 @@ class ConfigDialog(QDialog):
         submit_hotkeys = get_config("input.submit_hotkey", ["F4"])
         self.start_hotkey_edit.setText(", ".join(start_hotkeys))
         self.submit_hotkey_edit.setText(", ".join(submit_hotkeys))
+        self.live_preview_check.setChecked(get_config("input.live_preview", False))
         
         # General settings
         self.auto_save_check.setChecked(get_config("general.auto_save_config", True))
+        self.watch_config_check.setChecked(get_config("general.watch_config_file", True))
         self.check_updates_check.setChecked(get_config("general.check_for_updates", True))
         
         log_level = get_config("general.log_level", "INFO")
@@ -725,51 +764,58 @@ class ConfigDialog(QDialog):
     
     def save_current_config(self):
         """Save current UI values to configuration."""
-        # Overlay settings
-        set_config("overlay.initial_width", self.initial_width_spin.value())
-        set_config("overlay.initial_height", self.initial_height_spin.value())
-        set_config("overlay.min_width", self.min_width_spin.value())
-        set_config("overlay.min_height", self.min_height_spin.value())
-        set_config("overlay.start_visible", self.start_visible_check.isChecked())
-        set_config("overlay.always_on_top", self.always_on_top_check.isChecked())
-        set_config("overlay.opacity", self.opacity_spin.value() / 100.0)
-        
-        # Animation settings
-        set_config("animation.words_per_minute", self.wpm_spin.value())
-        set_config("animation.min_characters", self.min_chars_spin.value())
-        set_config("animation.max_characters", self.max_chars_spin.value())
-        set_config("animation.animation_delay_ms", self.animation_delay_spin.value())
-        
-        # Web server settings
-        set_config("web_server.host", self.host_edit.text())
-        set_config("web_server.port", self.port_spin.value())
-        set_config("web_server.auto_start", self.auto_start_check.isChecked())
-        
-        # UI settings
-        set_config("ui.theme", self.theme_combo.currentText())
-        set_config("ui.window_width", self.window_width_spin.value())
-        set_config("ui.window_height", self.window_height_spin.value())
-        
-        # Input settings
-        start_hotkeys = [k.strip() for k in self.start_hotkey_edit.text().split(",") if k.strip()]
-        submit_hotkeys = [k.strip() for k in self.submit_hotkey_edit.text().split(",") if k.strip()]
-        set_config("input.start_hotkey", start_hotkeys)
-        set_config("input.submit_hotkey", submit_hotkeys)
-        
-        # General settings
-        set_config("general.auto_save_config", self.auto_save_check.isChecked())
-        set_config("general.check_for_updates", self.check_updates_check.isChecked())
-        set_config("general.log_level", self.log_level_combo.currentText())
-        
-        # Twitch message send timing
-        set_config("twitch.send_timing", self.twitch_send_timing_combo.currentData())
-        
-        # TTS tab
-        set_config("tts.volume", self.tts_volume_spin.value())
-        set_config("tts.pitch", self.tts_pitch_spin.value())
-        set_config("tts.speed", self.tts_speed_spin.value())
-        set_config("tts.voice", self.tts_voice_combo.currentData())
-        set_config("tts.sync_overlay_wpm_with_tts", self.sync_overlay_wpm_check.isChecked())
+        # One save for the whole dialog instead of one per setting
+        with config_transaction():
+            # Overlay settings
+            set_config("overlay.initial_width", self.initial_width_spin.value())
+            set_config("overlay.initial_height", self.initial_height_spin.value())
+            set_config("overlay.min_width", self.min_width_spin.value())
+            set_config("overlay.min_height", self.min_height_spin.value())
+            set_config("overlay.start_visible", self.start_visible_check.isChecked())
+            set_config("overlay.always_on_top", self.always_on_top_check.isChecked())
+            set_config("overlay.opacity", self.opacity_spin.value() / 100.0)
+        
+            # Animation settings
+            set_config("animation.words_per_minute", self.wpm_spin.value())
+            set_config("animation.min_characters", self.min_chars_spin.value())
+            set_config("animation.max_characters", self.max_chars_spin.value())
+            set_config("animation.animation_delay_ms", self.animation_delay_spin.value())
+            set_config("animation.queue_policy", self.queue_policy_combo.currentData())
+            set_config("animation.queue_max_depth", self.queue_depth_spin.value())
+            set_config("animation.compress_queued_hold", self.compress_hold_check.isChecked())
+        
+            # Web server settings
+            set_config("web_server.host", self.host_edit.text())
+            set_config("web_server.port", self.port_spin.value())
+            set_config("web_server.auto_start", self.auto_start_check.isChecked())
+        
+            # UI settings
+            set_config("ui.theme", self.theme_combo.currentText())
+            set_config("ui.window_width", self.window_width_spin.value())
+            set_config("ui.window_height", self.window_height_spin.value())
+        
+            # Input settings
+            start_hotkeys = [k.strip() for k in self.start_hotkey_edit.text().split(",") if k.strip()]
+            submit_hotkeys = [k.strip() for k in self.submit_hotkey_edit.text().split(",") if k.strip()]
+            set_config("input.start_hotkey", start_hotkeys)
+            set_config("input.submit_hotkey", submit_hotkeys)
+            set_config("input.live_preview", self.live_preview_check.isChecked())
+        
+            # General settings
+            set_config("general.auto_save_config", self.auto_save_check.isChecked())
+            set_config("general.watch_config_file", self.watch_config_check.isChecked())
+            set_config("general.check_for_updates", self.check_updates_check.isChecked())
+            set_config("general.log_level", self.log_level_combo.currentText())
+        
+            # Twitch message send timing
+            set_config("twitch.send_timing", self.twitch_send_timing_combo.currentData())
+        
+            # TTS tab
+            set_config("tts.volume", self.tts_volume_spin.value())
+            set_config("tts.pitch", self.tts_pitch_spin.value())
+            set_config("tts.speed", self.tts_speed_spin.value())
+            set_config("tts.voice", self.tts_voice_combo.currentData())
+            set_config("tts.sync_overlay_wpm_with_tts", self.sync_overlay_wpm_check.isChecked())
         
         # Save to file
         save_config()
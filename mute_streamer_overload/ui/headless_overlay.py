@@ -0,0 +1,126 @@
+import argparse
+import logging
+import os
+import sys
+import threading
+
+from PyQt6.QtCore import QObject, QRectF, Qt, pyqtSignal
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter
+
+from mute_streamer_overload.core.text_animator import TextAnimator
+from mute_streamer_overload.ui.text_layout import (OverlayTextRenderer, available_text_area,
+                                                   HORIZONTAL_PADDING, VERTICAL_PADDING)
+from mute_streamer_overload.utils.config import get_config
+from mute_streamer_overload.utils.frame_buffer import FrameRingBuffer, default_buffer_path
+
+logger = logging.getLogger(__name__)
+
+
+class HeadlessOverlay(QObject):
+    """Renders overlay frames into a shared-memory ring buffer instead of a window.
+
+    Uses the same animator, layout and font fitting as OverlayWindow, and
+    places the text where the desktop overlay would (below its title bar).
+    A frame is rendered and published only when the shown text changes.
+    """
+    input_closed = pyqtSignal()  # Emitted by the stdin reader at end of input
+
+    def __init__(self, width, height, path=None, slots=3):
+        super().__init__()
+        self.width = width
+        self.height = height
+        self.buffer = FrameRingBuffer(path or default_buffer_path(), width, height, slots)
+        self.renderer = OverlayTextRenderer(
+            shadow=get_config("overlay.text_shadow", True),
+            outline=get_config("overlay.text_outline", False)
+        )
+        self.renderer.set_geometry(*available_text_area(width, height))
+        left = HORIZONTAL_PADDING / 2
+        top = VERTICAL_PADDING - HORIZONTAL_PADDING / 2
+        self.text_rect = QRectF(left, top, *available_text_area(width, height))
+        self.image = QImage(width, height, QImage.Format.Format_RGBA8888)
+
+        self.text_animator = TextAnimator(
+            words_per_minute=get_config("animation.words_per_minute", 200),
+            min_chars=get_config("animation.min_characters", 10),
+            max_chars=get_config("animation.max_characters", 50)
+        )
+        self.text_animator.text_updated.connect(self.show_text)
+        self.text_animator.animation_finished.connect(self._on_animation_finished)
+        self.text_animator.opacity_changed.connect(self.set_opacity)
+        self.renderer.opacity = self.text_animator.fader.opacity
+        self.render_frame()
+
+    def set_message(self, message):
+        """Animate message into the buffer (safe to call from any thread)"""
+        self.text_animator.start_animation(message)
+
+    def show_text(self, text):
+        if self.renderer.set_text(text):
+            self.render_frame()
+
+    def set_opacity(self, opacity):
+        if opacity != self.renderer.opacity:
+            self.renderer.opacity = opacity
+            self.render_frame()
+
+    def _on_animation_finished(self):
+        self.show_text(self.text_animator.current_message)
+
+    def render_frame(self):
+        self.image.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(self.image)
+        painter.setRenderHint(QPainter.RenderHint.TextAntialiasing)
+        self.renderer.paint(painter, self.text_rect)
+        painter.end()
+        pixels = self.image.constBits()
+        pixels.setsize(self.image.sizeInBytes())
+        return self.buffer.publish(pixels)
+
+    def close(self, unlink=False):
+        self.text_animator.stop_current_animation()
+        self.buffer.close(unlink)
+
+
+def _read_messages(overlay, stream):
+    for line in stream:
+        message = line.strip()
+        if message:
+            overlay.set_message(message)
+    overlay.input_closed.emit()
+
+
+def main(argv=None):
+    """Run the headless overlay, animating each line read from stdin"""
+    parser = argparse.ArgumentParser(description="Render the overlay into a shared-memory frame buffer")
+    parser.add_argument('--width', type=int, default=get_config("overlay.initial_width", 400))
+    parser.add_argument('--height', type=int, default=get_config("overlay.initial_height", 200))
+    parser.add_argument('--buffer', default=str(default_buffer_path()),
+                        help="Path of the memory-mapped frame buffer")
+    parser.add_argument('--slots', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    # No display needed; must be set before the application is created
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    app = QGuiApplication(sys.argv[:1])
+
+    overlay = HeadlessOverlay(args.width, args.height, args.buffer, args.slots)
+    logger.info(f"[HEADLESS] Writing {args.width}x{args.height} RGBA frames to {args.buffer}")
+
+    def quit_when_idle():
+        # Let the last message play out before exiting
+        if overlay.text_animator.is_running():
+            overlay.text_animator.animation_finished.connect(app.quit)
+        else:
+            app.quit()
+
+    overlay.input_closed.connect(quit_when_idle)
+    threading.Thread(target=_read_messages, args=(overlay, sys.stdin), daemon=True).start()
+    try:
+        return app.exec()
+    finally:
+        overlay.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
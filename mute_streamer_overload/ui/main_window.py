@@ -1,33 +1,36 @@
-import keyboard
 import logging
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QTextEdit,
                             QPushButton, QLabel, QHBoxLayout, QSpinBox, QApplication,
-                            QGroupBox, QGridLayout, QCheckBox)
-from PyQt6.QtCore import Qt
+                            QGroupBox, QGridLayout, QCheckBox, QComboBox, QInputDialog)
+from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QKeySequence, QShortcut, QIcon, QPixmap, QPainter
 from PyQt6.QtSvg import QSvgRenderer
 from pathlib import Path
 from functools import partial
 import time
 import threading
-import requests
 
 from mute_streamer_overload.core.input_handler import InputHandler
+from mute_streamer_overload.core.hotkey_manager import HotkeyManager, normalize_hotkey
 from mute_streamer_overload.ui.overlay_window import OverlayWindow
 from mute_streamer_overload.ui.config_dialog import ConfigDialog
-from mute_streamer_overload.web.web_server import update_message, update_animation_settings, stop_server, set_fade_out_callback
+from mute_streamer_overload.web.web_server import (update_message, update_animation_settings, update_queue_policy,
+                                                  update_preview, stop_server, set_fade_out_callback)
 from mute_streamer_overload.utils.constants import (MIN_OVERLAY_WIDTH, MIN_OVERLAY_HEIGHT,
                                                   INITIAL_OVERLAY_WIDTH, INITIAL_OVERLAY_HEIGHT)
-from mute_streamer_overload.utils.config import get_config, set_config, save_config
+from mute_streamer_overload.utils.config import (get_config, set_config, save_config, update_config, on_change,
+                                                  watch_config, stop_watching_config, config_snapshot,
+                                                  list_profiles, active_profile, save_profile, switch_profile)
 from mute_streamer_overload.twitch_oauth import send_message_to_twitch_chat
-from tts_service.tts_integration import speak
+from mute_streamer_overload.utils import http_client
+from tts_service.tts_integration import speak, speculate
 
 logger = logging.getLogger(__name__)
 
-def _normalize_hotkey(key):
-    return key.strip().lower().replace(' ', '')
-
 class MuteStreamerOverload(QMainWindow):
+    # Keys changed by an external edit of the config file (emitted from the watcher thread)
+    external_config_changed = pyqtSignal(list)
+
     def __init__(self):
         super().__init__()
         logger.debug("Initializing main window...")
@@ -39,11 +42,17 @@ class MuteStreamerOverload(QMainWindow):
         self.setMinimumSize(min_width, min_height)
         self.current_start_hotkeys = get_config("input.start_hotkey", ["F4"])
         self.current_submit_hotkeys = get_config("input.submit_hotkey", ["F4"])
+        # Checked on every submit; the subscription keeps it current
+        self.send_timing = get_config("twitch.send_timing", "immediate")
+        self._unsubscribe_send_timing = on_change("twitch.send_timing", self._on_send_timing_changed)
         self.center_window()
         self.setup_icon()
         self.setup_ui()
         self.setup_logic()
         self.load_config_values()
+        # Show overlay on startup if configured
+        if get_config("overlay.start_visible", False):
+            self.toggle_overlay()
         
         # Flag to prevent duplicate Twitch message sends
         self.twitch_message_sent = False
@@ -89,6 +98,18 @@ class MuteStreamerOverload(QMainWindow):
         title_label.setObjectName("TitleLabel")
         title_layout.addWidget(title_label)
         
+        # Profile switcher
+        self.profile_combo = QComboBox()
+        self.profile_combo.setToolTip("Settings profile")
+        self.profile_combo.textActivated.connect(self.on_profile_selected)
+        title_layout.addWidget(self.profile_combo)
+        
+        self.new_profile_button = QPushButton("+")
+        self.new_profile_button.setToolTip("Save the current settings as a new profile")
+        self.new_profile_button.setMaximumWidth(30)
+        self.new_profile_button.clicked.connect(self.create_profile)
+        title_layout.addWidget(self.new_profile_button)
+        
         self.settings_button = QPushButton("⚙ Settings")
         self.settings_button.setObjectName("SettingsButton")
         self.settings_button.clicked.connect(self.open_settings)
@@ -205,6 +226,8 @@ class MuteStreamerOverload(QMainWindow):
         """Set up application logic, state, and event connections."""
         self.overlay_window = OverlayWindow()
         self.input_handler = InputHandler()
+        self.hotkey_manager = HotkeyManager(self.input_handler)
+        self.hotkey_manager.install()
         self.current_message = ""
         self.overlay_visible = False
         
@@ -212,6 +235,10 @@ class MuteStreamerOverload(QMainWindow):
         self.input_handler.submit_signal.connect(self.handle_submit)
         self.input_handler.text_updated.connect(self.update_text_display)
         self.input_handler.input_state_changed.connect(self.update_input_state)
+        self.input_handler.preview_delta.connect(self.overlay_window.apply_preview_delta)
+        self.input_handler.preview_delta.connect(update_preview)
+        # Start synthesizing speech while the user pauses, before they submit
+        self.input_handler.typing_paused.connect(speculate)
         
         self.overlay_window.text_animator.fade_out.connect(self.on_fade_out)
         
@@ -221,13 +248,14 @@ class MuteStreamerOverload(QMainWindow):
         self.qt_submit_shortcuts = []
         self.bind_hotkeys()
         self.update_input_state(False)
+        
+        # Pick up edits made to the config file while the app is running
+        self.external_config_changed.connect(self.on_external_config_changed)
+        self._unsubscribe_watch = on_change("general.watch_config_file", self._on_watch_setting_changed)
+        self._on_watch_setting_changed("general.watch_config_file", get_config("general.watch_config_file", True))
 
     def bind_hotkeys(self):
-        # Unbind all previous
-        try:
-            keyboard.unhook_all()
-        except Exception:
-            pass
+        """Apply the configured hotkeys; only registrations that changed are touched"""
         for shortcut in getattr(self, 'qt_start_shortcuts', []):
             shortcut.setKey(QKeySequence())
         for shortcut in getattr(self, 'qt_submit_shortcuts', []):
@@ -239,7 +267,7 @@ class MuteStreamerOverload(QMainWindow):
         self.submit_hotkeys = get_config("input.submit_hotkey", ["F4"])
         # Register QShortcut and global hotkey for start hotkey
         for key in self.start_hotkeys:
-            norm_key = _normalize_hotkey(key)
+            norm_key = normalize_hotkey(key)
             print(f"[DEBUG] Registering start hotkey: {norm_key}")
             # QShortcut (window-focused)
             sc = QShortcut(QKeySequence(key), self)
@@ -248,11 +276,8 @@ class MuteStreamerOverload(QMainWindow):
                 self.handle_start_typing()
             sc.activated.connect(start_typing_debug)
             self.qt_start_shortcuts.append(sc)
-            # Global hotkey
-            def global_start_hotkey(event, action='start', key=norm_key):
-                logger.debug(f"[HOTKEY] keyboard.on_press_key start activated for key: {key}, event: {event}")
-                return self.input_handler.on_hotkey_press(event, action, key)
-            keyboard.on_press_key(norm_key, global_start_hotkey, suppress=suppress)
+        # Global hotkeys
+        self.hotkey_manager.set_start_hotkeys(self.start_hotkeys, suppress)
         logger.info(f"Start hotkeys: {self.start_hotkeys}, Submit hotkeys: {self.submit_hotkeys}, suppress={suppress}")
 
     def rebind_hotkey(self):
@@ -264,53 +289,159 @@ class MuteStreamerOverload(QMainWindow):
         self.rebind_hotkey()
         logger.info("Configuration updated and applied")
 
+    def on_external_config_changed(self, keys):
+        """Apply settings that were edited in the config file outside the app."""
+        self.apply_config_changes(keys)
+        if "general.active_profile" in keys:
+            self.refresh_profiles()
+        logger.info(f"[CONFIG] Applied external changes: {', '.join(keys)}")
+
+    def apply_config_changes(self, keys):
+        """Push changed settings to the live components; parts whose keys didn't change are left alone."""
+        keys = set(keys)
+        if not keys:
+            return
+        config = config_snapshot()
+
+        def changed(*names):
+            return not keys.isdisjoint(names)
+
+        # Widgets are updated with signals blocked so they don't write the
+        # half-applied values back to the config
+        if changed("overlay.initial_width", "overlay.initial_height"):
+            self._set_quietly(self.width_input, config.overlay.initial_width)
+            self._set_quietly(self.height_input, config.overlay.initial_height)
+            self.overlay_window.resize(config.overlay.initial_width, config.overlay.initial_height)
+            self.overlay_window.adjust_font_size()
+        if changed("overlay.opacity"):
+            self.overlay_window.set_opacity(config.overlay.opacity)
+        if changed("overlay.text_shadow", "overlay.text_outline"):
+            self.overlay_window.message_view.set_effects(config.overlay.text_shadow, config.overlay.text_outline)
+
+        animation = config.animation
+        if changed("animation.words_per_minute"):
+            self._set_quietly(self.wpm_input, animation.words_per_minute)
+            self.overlay_window.text_animator.set_words_per_minute(animation.words_per_minute)
+            update_animation_settings(wpm=animation.words_per_minute)
+        if changed("animation.min_characters", "animation.max_characters"):
+            self._set_quietly(self.min_chars_input, animation.min_characters)
+            self._set_quietly(self.max_chars_input, animation.max_characters)
+            self.overlay_window.text_animator.set_character_limits(animation.min_characters, animation.max_characters)
+            update_animation_settings(min_chars=animation.min_characters, max_chars=animation.max_characters)
+        if changed("animation.queue_policy", "animation.queue_max_depth", "animation.compress_queued_hold"):
+            self.overlay_window.text_animator.set_queue_policy(
+                animation.queue_policy, animation.queue_max_depth, animation.compress_queued_hold)
+            update_queue_policy(animation.queue_policy, animation.queue_max_depth, animation.compress_queued_hold)
+
+        if changed("input.live_preview"):
+            self.input_handler.set_live_preview(config.input.live_preview)
+        if changed("input.start_hotkey", "input.submit_hotkey", "input.suppress_hotkey"):
+            self.input_handler.update_submit_hotkeys()
+            self.rebind_hotkey()
+            self._update_hotkey_labels(config.input.start_hotkey)
+
+        if changed("twitch.send_messages"):
+            self._set_quietly(self.send_to_twitch_checkbox, config.twitch.send_messages)
+        if changed("tts.sync_overlay_wpm_with_tts"):
+            self._set_quietly(self.sync_overlay_wpm_check, config.tts.sync_overlay_wpm_with_tts)
+            self.wpm_input.setEnabled(not config.tts.sync_overlay_wpm_with_tts)
+        # Other tts.* settings are read through config keys when speech is generated
+
+    def _set_quietly(self, widget, value):
+        widget.blockSignals(True)
+        if isinstance(widget, QCheckBox):
+            widget.setChecked(value)
+        else:
+            widget.setValue(value)
+        widget.blockSignals(False)
+
+    def _update_hotkey_labels(self, start_hotkeys):
+        first_hotkey = start_hotkeys[0] if start_hotkeys else "F4"
+        if not self.input_handler.is_active:
+            self.status_label.setText(f"Press {first_hotkey} to start typing")
+        self.submit_button.setText(f"Submit ({first_hotkey})")
+
+    def refresh_profiles(self):
+        """Fill the profile selector from the config."""
+        self.profile_combo.blockSignals(True)
+        self.profile_combo.clear()
+        self.profile_combo.addItems(list_profiles())
+        self.profile_combo.setCurrentText(active_profile())
+        self.profile_combo.blockSignals(False)
+
+    def on_profile_selected(self, name):
+        if name == active_profile():
+            return
+        changed = switch_profile(name)
+        self.apply_config_changes(changed)
+        logger.info(f"[CONFIG] Switched to profile '{name}' ({len(changed)} settings changed)")
+
+    def create_profile(self):
+        name, ok = QInputDialog.getText(self, "New Profile", "Save the current settings as:")
+        name = name.strip()
+        if not ok or not name:
+            return
+        save_profile(name)
+        switch_profile(name)
+        self.refresh_profiles()
+
+    def _on_watch_setting_changed(self, key, enabled):
+        if enabled:
+            watch_config(self.external_config_changed.emit)
+        else:
+            stop_watching_config()
+
     def load_config_values(self):
         """Load configuration values into the UI."""
+        config = config_snapshot()
+        
         # Load overlay size
-        initial_width = get_config("overlay.initial_width", 300)
-        initial_height = get_config("overlay.initial_height", 200)
+        initial_width = config.overlay.initial_width
+        initial_height = config.overlay.initial_height
         self.width_input.setValue(initial_width)
         self.height_input.setValue(initial_height)
         
         # Load animation settings
-        wpm = get_config("animation.words_per_minute", 500)
-        min_chars = get_config("animation.min_characters", 10)
-        max_chars = get_config("animation.max_characters", 50)
+        animation = config.animation
+        wpm = animation.words_per_minute
+        min_chars = animation.min_characters
+        max_chars = animation.max_characters
         
         self.wpm_input.setValue(wpm)
         self.min_chars_input.setValue(min_chars)
         self.max_chars_input.setValue(max_chars)
         
         # Load Twitch settings
-        send_to_twitch = get_config("twitch.send_messages", True)
-        self.send_to_twitch_checkbox.setChecked(send_to_twitch)
+        self.send_to_twitch_checkbox.setChecked(config.twitch.send_messages)
         
         # Load window size
-        window_width = get_config("ui.window_width", 600)
-        window_height = get_config("ui.window_height", 500)
-        self.resize(window_width, window_height)
+        self.resize(config.ui.window_width, config.ui.window_height)
         
         # Apply settings to overlay
         if self.overlay_window:
             self.overlay_window.resize(initial_width, initial_height)
+            self.overlay_window.set_opacity(config.overlay.opacity)
             self.overlay_window.text_animator.set_words_per_minute(wpm)
             self.overlay_window.text_animator.set_character_limits(min_chars, max_chars)
         
         # Update web server settings
         update_animation_settings(wpm=wpm, min_chars=min_chars, max_chars=max_chars)
         
-        # Show overlay on startup if configured
-        if get_config("overlay.start_visible", False):
-            self.toggle_overlay()
+        # Apply the same queue policy to every renderer
+        if self.overlay_window:
+            self.overlay_window.text_animator.set_queue_policy(
+                animation.queue_policy, animation.queue_max_depth, animation.compress_queued_hold)
+        update_queue_policy(animation.queue_policy, animation.queue_max_depth, animation.compress_queued_hold)
+        
+        if hasattr(self, 'input_handler'):
+            self.input_handler.set_live_preview(config.input.live_preview)
 
         # Reflect first start hotkey in status label and submit button
-        start_hotkeys = get_config("input.start_hotkey", ["F4"])
-        first_hotkey = start_hotkeys[0] if start_hotkeys else "F4"
-        self.status_label.setText(f"Press {first_hotkey} to start typing")
-        self.submit_button.setText(f"Submit ({first_hotkey})")
+        self._update_hotkey_labels(config.input.start_hotkey)
+        self.refresh_profiles()
 
         # Load TTS sync settings
-        self.sync_overlay_wpm_check.setChecked(get_config("tts.sync_overlay_wpm_with_tts", True))
+        self.sync_overlay_wpm_check.setChecked(config.tts.sync_overlay_wpm_with_tts)
         self.wpm_input.setEnabled(not self.sync_overlay_wpm_check.isChecked())
 
     def open_settings(self):
@@ -327,8 +458,7 @@ class MuteStreamerOverload(QMainWindow):
             max_chars = min_chars
         
         # Save to config
-        set_config("animation.min_characters", min_chars)
-        set_config("animation.max_characters", max_chars)
+        update_config({"animation.min_characters": min_chars, "animation.max_characters": max_chars})
         
         if self.overlay_window:
             self.overlay_window.text_animator.set_character_limits(min_chars, max_chars)
@@ -346,7 +476,7 @@ class MuteStreamerOverload(QMainWindow):
         # If not syncing with TTS, update the web overlay immediately
         if not self.sync_overlay_wpm_check.isChecked():
             try:
-                requests.post('http://127.0.0.1:5000/set_overlay_wpm', json={'wpm': wpm})
+                http_client.post('http://127.0.0.1:5000/set_overlay_wpm', json={'wpm': wpm})
             except Exception as e:
                 print(f"Failed to update overlay WPM: {e}")
             
@@ -355,8 +485,7 @@ class MuteStreamerOverload(QMainWindow):
         height = self.height_input.value()
         
         # Save to config
-        set_config("overlay.initial_width", width)
-        set_config("overlay.initial_height", height)
+        update_config({"overlay.initial_width": width, "overlay.initial_height": height})
         
         if self.overlay_window:
             self.overlay_window.resize(width, height)
@@ -402,17 +531,14 @@ class MuteStreamerOverload(QMainWindow):
                 # TTS: Speak the submitted message in a background thread
                 threading.Thread(target=speak, args=(current_text,), daemon=True).start()
                 # Send to Twitch chat if enabled and timing is 'immediate'
-                if self.send_to_twitch_checkbox.isChecked() and get_config("twitch.send_timing", "immediate") == "immediate":
+                if self.send_to_twitch_checkbox.isChecked() and self.send_timing == "immediate":
                     logger.info(f"[TWITCH] Sending message immediately: {current_text}")
                     send_message_to_twitch_chat(current_text)
                     self.twitch_message_sent = True
                 else:
-                    logger.info(f"[TWITCH] Not sending immediately - checkbox: {self.send_to_twitch_checkbox.isChecked()}, timing: {get_config('twitch.send_timing', 'immediate')}")
-            self.input_handler.is_active = False
+                    logger.info(f"[TWITCH] Not sending immediately - checkbox: {self.send_to_twitch_checkbox.isChecked()}, timing: {self.send_timing}")
             self.input_handler.f4_pressed = False
-            self.input_handler.input_state_changed.emit(False)
-            keyboard.unhook_all()  # Unregister submit hotkey after submission
-            self.bind_hotkeys()  # Re-register start hotkey
+            self.input_handler.set_active(False)
         else:
             # Submission from button (not hotkey mode)
             message = self.message_input.toPlainText().strip()
@@ -426,12 +552,12 @@ class MuteStreamerOverload(QMainWindow):
                 self.input_handler.clear_text()
                 # TTS: Speak the submitted message in a background thread
                 threading.Thread(target=speak, args=(message,), daemon=True).start()
-                if self.send_to_twitch_checkbox.isChecked() and get_config("twitch.send_timing", "immediate") == "immediate":
+                if self.send_to_twitch_checkbox.isChecked() and self.send_timing == "immediate":
                     logger.info(f"[TWITCH] Sending message immediately (button mode): {message}")
                     send_message_to_twitch_chat(message)
                     self.twitch_message_sent = True
                 else:
-                    logger.info(f"[TWITCH] Not sending immediately (button mode) - checkbox: {self.send_to_twitch_checkbox.isChecked()}, timing: {get_config('twitch.send_timing', 'immediate')}")
+                    logger.info(f"[TWITCH] Not sending immediately (button mode) - checkbox: {self.send_to_twitch_checkbox.isChecked()}, timing: {self.send_timing}")
     
     def update_text_display(self, text):
         self.message_input.setText(text)
@@ -465,15 +591,19 @@ class MuteStreamerOverload(QMainWindow):
     
     def closeEvent(self, event):
         # Save window position and size to config
-        set_config("ui.window_width", self.width())
-        set_config("ui.window_height", self.height())
-        set_config("ui.window_x", self.x())
-        set_config("ui.window_y", self.y())
+        update_config({
+            "ui.window_width": self.width(),
+            "ui.window_height": self.height(),
+            "ui.window_x": self.x(),
+            "ui.window_y": self.y()
+        })
         save_config()
+        self._unsubscribe_send_timing()
+        self._unsubscribe_watch()
+        stop_watching_config()
         
-        keyboard.unhook_all()
-        if hasattr(self, 'input_handler'):
-            self.input_handler.timer.stop()
+        if hasattr(self, 'hotkey_manager'):
+            self.hotkey_manager.shutdown()
         if hasattr(self, 'overlay_window'):
             self.overlay_window.close()
         stop_server()
@@ -511,15 +641,18 @@ class MuteStreamerOverload(QMainWindow):
             time.sleep(2)
             # Only send to Twitch chat if the toggle is enabled, timing is 'after_animation', and message hasn't been sent yet
             if (self.send_to_twitch_checkbox.isChecked() and 
-                get_config("twitch.send_timing", "immediate") == "after_animation" and 
+                self.send_timing == "after_animation" and 
                 not self.twitch_message_sent):
                 logger.info(f"[TWITCH] Sending message after animation: {message}")
                 send_message_to_twitch_chat(message)
                 self.twitch_message_sent = True
             else:
-                logger.info(f"[TWITCH] Not sending after animation - checkbox: {self.send_to_twitch_checkbox.isChecked()}, timing: {get_config('twitch.send_timing', 'immediate')}, already sent: {self.twitch_message_sent}")
+                logger.info(f"[TWITCH] Not sending after animation - checkbox: {self.send_to_twitch_checkbox.isChecked()}, timing: {self.send_timing}, already sent: {self.twitch_message_sent}")
         threading.Thread(target=send_after_delay, daemon=True).start()
 
+    def _on_send_timing_changed(self, key, value):
+        self.send_timing = value
+
     def on_twitch_toggle_changed(self, checked):
         """Handle Twitch chat toggle state change."""
         set_config("twitch.send_messages", checked)
@@ -0,0 +1,57 @@
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import QRectF
+from PyQt6.QtGui import QPainter
+
+from mute_streamer_overload.ui.text_layout import OverlayTextRenderer
+from mute_streamer_overload.utils.config import get_config
+
+# Inner padding between the widget edge and the text box
+TEXT_MARGIN = 10
+
+
+class OverlayTextWidget(QWidget):
+    """Draws the overlay message with QPainter through an OverlayTextRenderer"""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.renderer = OverlayTextRenderer(
+            shadow=get_config("overlay.text_shadow", True),
+            outline=get_config("overlay.text_outline", False)
+        )
+
+    def text(self):
+        return self.renderer.text
+
+    def setText(self, text):
+        """Show text, laying out only what changed; repaints only on change"""
+        if self.renderer.set_text(text):
+            self.update()
+
+    def set_opacity(self, opacity):
+        """Fade the text; repaints from cached glyphs without any relayout"""
+        if opacity != self.renderer.opacity:
+            self.renderer.opacity = opacity
+            self.update()
+
+    def set_effects(self, shadow=None, outline=None):
+        self.renderer.set_effects(shadow, outline)
+        self.update()
+
+    def refit(self):
+        """Re-run layout and font fitting for the current widget size"""
+        if self.renderer.set_geometry(*self._text_box_size()):
+            self.update()
+
+    def _text_box_size(self):
+        return self.width() - 2 * TEXT_MARGIN, self.height() - 2 * TEXT_MARGIN
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.refit()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        self.renderer.device_pixel_ratio = self.devicePixelRatioF()
+        rect = QRectF(self.rect()).adjusted(TEXT_MARGIN, TEXT_MARGIN, -TEXT_MARGIN, -TEXT_MARGIN)
+        self.renderer.paint(painter, rect)
+        painter.end()
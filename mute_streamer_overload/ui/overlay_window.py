@@ -1,16 +1,22 @@
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QMainWindow
-from PyQt6.QtCore import Qt, QPoint
+from PyQt6.QtCore import Qt, QPoint, QTimer
 from PyQt6.QtGui import QWindow, QIcon
 from pathlib import Path
 import re
+import time
 import logging
 
 from mute_streamer_overload.core.text_animator import TextAnimator
+from mute_streamer_overload.ui.overlay_text_widget import OverlayTextWidget
 from mute_streamer_overload.utils.constants import (TITLE_BAR_STYLE, CLOSE_BUTTON_STYLE, 
-                      MESSAGE_LABEL_STYLE, CONTENT_WIDGET_STYLE)
+                      CONTENT_WIDGET_STYLE)
 from mute_streamer_overload.web.web_server import update_message
 from mute_streamer_overload.utils.config import get_config
 
+# How often the paint count is logged while the overlay is shown
+PAINT_REPORT_INTERVAL_MS = 60_000
+
+
 class OverlayWindow(QMainWindow):
     def __init__(self):
         super().__init__(None)  # No parent window
@@ -81,12 +87,9 @@ class OverlayWindow(QMainWindow):
         content_layout = QVBoxLayout(self.content_widget)
         content_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Create message label
-        self.message_label = QLabel()
-        self.message_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.message_label.setStyleSheet(MESSAGE_LABEL_STYLE)
-        self.message_label.setWordWrap(True)
-        content_layout.addWidget(self.message_label)
+        # Create message view (painted text, see OverlayTextWidget)
+        self.message_view = OverlayTextWidget()
+        content_layout.addWidget(self.message_view)
         
         main_layout.addWidget(self.content_widget)
         
@@ -105,6 +108,19 @@ class OverlayWindow(QMainWindow):
         # Store the current message for font size calculations
         self.current_message = ""
         
+        # In-progress text streamed from the input handler (live preview)
+        self.preview_text = ""
+        self._showing_preview = False
+        
+        # Number of paint events handled; stays flat while nothing changes.
+        # Reported at info level once a minute while shown and again on hide
+        self.frames_painted = 0
+        self._frames_reported = 0
+        self._reported_at = time.monotonic()
+        self._paint_report_timer = QTimer(self)
+        self._paint_report_timer.setInterval(PAINT_REPORT_INTERVAL_MS)
+        self._paint_report_timer.timeout.connect(self._report_paint_rate)
+        
         # Create text animator with config values
         wpm = get_config("animation.words_per_minute", 500)
         min_chars = get_config("animation.min_characters", 10)
@@ -117,6 +133,8 @@ class OverlayWindow(QMainWindow):
         )
         self.text_animator.text_updated.connect(self._update_animated_text)
         self.text_animator.animation_finished.connect(self._on_animation_finished)
+        self.text_animator.opacity_changed.connect(self.message_view.set_opacity)
+        self.message_view.set_opacity(self.text_animator.fader.opacity)
         
         # Set window title and properties for better capture
         self.setWindowTitle("Message Overlay")
@@ -124,6 +142,8 @@ class OverlayWindow(QMainWindow):
     def showEvent(self, event):
         """Handle window show event to ensure proper window state"""
         super().showEvent(event)
+        self._frames_reported, self._reported_at = self.frames_painted, time.monotonic()
+        self._paint_report_timer.start()
         # Ensure the window is properly layered and visible to capture software
         self.setWindowState(self.windowState() & ~Qt.WindowState.WindowMinimized)
         self.raise_()
@@ -161,53 +181,36 @@ class OverlayWindow(QMainWindow):
             update_message(message)
             print(f"[OVERLAY] trigger_web_animation completed - web server animation only")
             
+    def apply_preview_delta(self, keep, insert):
+        """Apply a live-preview edit; shown only while no animation is playing"""
+        self.preview_text = self.preview_text[:keep] + insert
+        if self.text_animator.is_running():
+            self._showing_preview = False
+            return
+        if self.preview_text:
+            if not self._showing_preview:
+                self._showing_preview = True
+                self.text_animator.fader.set_opacity(1.0)
+            self.message_view.setText(self.preview_text)
+        elif self._showing_preview:
+            self._showing_preview = False
+            self.text_animator.fader.set_opacity(0.0)
+            self.message_view.setText("")
+            
     def _update_animated_text(self, text):
         """Update the label with animated text"""
-        self.message_label.setText(text)
-        self.adjust_font_size()
+        self.message_view.setText(text)
             
     def _on_animation_finished(self):
         """Handle animation completion"""
-        # Show the full message when animation is done
-        self.message_label.setText(self.current_message)
-        self.adjust_font_size()
+        # Show the full message when animation is done (the animator's copy
+        # reflects any queued or merged message that played last)
+        self.message_view.setText(self.text_animator.current_message)
             
     def adjust_font_size(self):
-        """Dynamically adjust font size to fit the text in the window"""
-        if not self.message_label.text():
-            return
-            
-        # Get the available space (accounting for padding and title bar)
-        available_width = self.width() - 40  # 20px padding on each side
-        available_height = self.height() - 70  # Title bar + padding
-        
-        # Start with a large font size
-        font_size = 100
-        font = self.message_label.font()
-        
-        while font_size > 8:  # Don't go smaller than 8pt
-            font.setPointSize(font_size)
-            self.message_label.setFont(font)
-            
-            # Get the size the text would need with word wrapping
-            text_rect = self.message_label.fontMetrics().boundingRect(
-                0, 0, available_width, available_height,
-                Qt.TextFlag.TextWordWrap,
-                self.message_label.text()
-            )
-            
-            # If the text fits, we're done
-            if text_rect.width() <= available_width and text_rect.height() <= available_height:
-                break
-                
-            # Otherwise, try a smaller font size
-            font_size -= 1
+        """Re-fit the message text to the current window size"""
+        self.message_view.refit()
             
-    def resizeEvent(self, event):
-        """Handle window resize"""
-        super().resizeEvent(event)
-        self.adjust_font_size()
-        
     def mousePressEvent(self, event):
         """Handle mouse press for window dragging"""
         if event.button() == Qt.MouseButton.LeftButton:
@@ -227,8 +230,15 @@ class OverlayWindow(QMainWindow):
         """Handle mouse release"""
         self.old_pos = None
         
+    def set_opacity(self, opacity):
+        """Change window opacity; the compositor repaints, no relayout needed"""
+        if opacity != self.windowOpacity():
+            self.setWindowOpacity(opacity)
+        
     def hideEvent(self, event):
         """Stop animation when window is hidden"""
+        self._paint_report_timer.stop()
+        self._report_paint_rate()
         self.text_animator.stop_current_animation()
         super().hideEvent(event)
         
@@ -238,7 +248,19 @@ class OverlayWindow(QMainWindow):
         event.accept()
         
     def paintEvent(self, event):
-        """Ensure proper painting for capture"""
+        """Paint only when Qt reports damage (text, size or opacity changes).
+
+        The window keeps its last frame between paints, so capture software
+        still sees it while idle; frames_painted makes the idle rate visible.
+        """
         super().paintEvent(event)
-        # Force a repaint to ensure the window is properly rendered
-        self.update() 
\ No newline at end of file
+        self.frames_painted += 1
+        
+    def _report_paint_rate(self):
+        """Log how many frames were painted since the last report"""
+        now = time.monotonic()
+        frames = self.frames_painted - self._frames_reported
+        elapsed = now - self._reported_at
+        self._frames_reported, self._reported_at = self.frames_painted, now
+        logging.getLogger(__name__).info(f"[OVERLAY] {frames} frames painted in the last {elapsed:.0f}s "
+                                         f"({frames / max(elapsed, 1e-3):.2f} fps)")
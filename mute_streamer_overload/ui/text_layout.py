@@ -0,0 +1,208 @@
+import math
+from collections import OrderedDict
+from functools import lru_cache
+
+from PyQt6.QtCore import Qt, QPointF
+from PyQt6.QtGui import (QColor, QFont, QFontMetrics, QFontMetricsF, QImage, QPainter,
+                         QPainterPath, QPen)
+
+from mute_streamer_overload.utils.constants import (MESSAGE_TEXT_COLOR, MESSAGE_SHADOW_COLOR,
+                                                    MESSAGE_OUTLINE_COLOR, MESSAGE_SHADOW_OFFSET,
+                                                    MESSAGE_OUTLINE_WIDTH)
+
+# Font sizes the overlay is allowed to pick from
+MIN_FONT_SIZE = 8
+MAX_FONT_SIZE = 100
+
+# Space taken from the overlay window by padding and the title bar
+HORIZONTAL_PADDING = 40  # 20px padding on each side
+VERTICAL_PADDING = 70  # Title bar + padding
+
+
+def available_text_area(width, height):
+    """Return the (width, height) left for message text in an overlay of the given size"""
+    return width - HORIZONTAL_PADDING, height - VERTICAL_PADDING
+
+
+def _fits(text, width, height, family, weight, size):
+    font = QFont(family)
+    font.setWeight(weight)
+    font.setPointSize(size)
+    rect = QFontMetrics(font).boundingRect(0, 0, width, height, Qt.TextFlag.TextWordWrap, text)
+    return rect.width() <= width and rect.height() <= height
+
+
+@lru_cache(maxsize=256)
+def fit_font_size(text, width, height, family, weight=QFont.Weight.Normal):
+    """Largest point size at which text word-wraps into width x height.
+
+    Binary search over detached QFontMetrics, so no widget is touched while
+    probing; memoized by (text, width, height, family, weight).
+    """
+    if width <= 0 or height <= 0:
+        return MIN_FONT_SIZE
+    low, high = MIN_FONT_SIZE, MAX_FONT_SIZE
+    while low < high:
+        mid = (low + high + 1) // 2
+        if _fits(text, width, height, family, weight, mid):
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+class _Word:
+    __slots__ = ('text', 'x', 'width')
+
+    def __init__(self, text, x, width):
+        self.text = text
+        self.x = x
+        self.width = width
+
+
+class OverlayTextRenderer:
+    """Lays out and paints overlay text with QPainter, independent of any widget.
+
+    Words are placed greedily into centered lines inside a width x height
+    box. When new text only appends words to the current text, just the new
+    words are laid out, and the font is re-fitted only once they overflow
+    the box. Shadow and outline effects are rendered once per word into
+    cached images and then blitted. opacity only affects painting, so
+    fading never touches the layout.
+    """
+
+    IMAGE_CACHE_SIZE = 512
+
+    def __init__(self, family=None, weight=QFont.Weight.Bold, shadow=True, outline=False):
+        self.font = QFont(family) if family else QFont()
+        self.font.setWeight(weight)
+        self.shadow = shadow
+        self.outline = outline
+        self.width = 0
+        self.height = 0
+        self.text = ""
+        self.font_size = None
+        self.lines = []
+        self.line_widths = []
+        self.device_pixel_ratio = 1.0
+        self.opacity = 1.0
+        self.words_laid_out = 0
+        self._metrics = None
+        self._space = 0.0
+        self._line_height = 0.0
+        self._images = OrderedDict()
+
+    def set_geometry(self, width, height):
+        """Set the text box size; returns True if the layout changed"""
+        if (width, height) == (self.width, self.height):
+            return False
+        self.width, self.height = width, height
+        self._relayout()
+        return True
+
+    def set_effects(self, shadow=None, outline=None):
+        if shadow is not None:
+            self.shadow = shadow
+        if outline is not None:
+            self.outline = outline
+
+    def set_text(self, text):
+        """Set the text to show; returns True if anything changed"""
+        if text == self.text:
+            return False
+        previous = self.text
+        self.text = text
+        if previous and text.startswith(previous + ' ') and self.font_size is not None:
+            # Additive animation: only lay out the words that were appended
+            for word in text[len(previous) + 1:].split():
+                if not self._place(word):
+                    self._relayout()
+                    break
+        else:
+            self._relayout()
+        return True
+
+    def paint(self, painter, rect):
+        """Paint the laid-out text centered in rect (a QRectF)"""
+        if not self.lines or self.opacity <= 0:
+            return
+        painter.setOpacity(self.opacity)
+        painter.setFont(self.font)
+        painter.setPen(QColor(*MESSAGE_TEXT_COLOR))
+        effects = self.shadow or self.outline
+        pad = self._effect_padding()
+        ascent = self._metrics.ascent()
+        y = rect.y() + (rect.height() - len(self.lines) * self._line_height) / 2
+        for line, line_width in zip(self.lines, self.line_widths):
+            x0 = rect.x() + (rect.width() - line_width) / 2
+            for word in line:
+                if effects:
+                    painter.drawImage(QPointF(x0 + word.x - pad, y - pad), self._effect_image(word))
+                else:
+                    painter.drawText(QPointF(x0 + word.x, y + ascent), word.text)
+            y += self._line_height
+
+    def _fit(self):
+        if not self.text:
+            return self.font_size
+        return fit_font_size(self.text, self.width, self.height, self.font.family(), self.font.weight())
+
+    def _relayout(self):
+        self.lines = []
+        self.line_widths = []
+        size = self._fit()
+        if size is None:
+            return
+        self.font_size = size
+        self.font.setPointSize(size)
+        self._metrics = QFontMetricsF(self.font)
+        self._space = self._metrics.horizontalAdvance(' ')
+        self._line_height = self._metrics.lineSpacing()
+        for word in self.text.split():
+            self._place(word)
+
+    def _place(self, text):
+        """Append a word to the layout; False if it no longer fits the box"""
+        width = self._metrics.horizontalAdvance(text)
+        if self.lines and self.line_widths[-1] + self._space + width <= self.width:
+            x = self.line_widths[-1] + self._space
+        else:
+            self.lines.append([])
+            self.line_widths.append(0.0)
+            x = 0.0
+        self.lines[-1].append(_Word(text, x, width))
+        self.line_widths[-1] = x + width
+        self.words_laid_out += 1
+        return width <= self.width and len(self.lines) * self._line_height <= self.height
+
+    def _effect_padding(self):
+        return MESSAGE_SHADOW_OFFSET + MESSAGE_OUTLINE_WIDTH
+
+    def _effect_image(self, word):
+        key = (word.text, self.font_size, self.device_pixel_ratio, self.shadow, self.outline)
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+            return image
+        pad = self._effect_padding()
+        ratio = self.device_pixel_ratio
+        image = QImage(math.ceil((word.width + 2 * pad) * ratio),
+                       math.ceil((self._line_height + 2 * pad) * ratio),
+                       QImage.Format.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(ratio)
+        image.fill(Qt.GlobalColor.transparent)
+        path = QPainterPath()
+        path.addText(pad, pad + self._metrics.ascent(), self.font, word.text)
+        painter = QPainter(image)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        if self.shadow:
+            painter.fillPath(path.translated(MESSAGE_SHADOW_OFFSET, MESSAGE_SHADOW_OFFSET),
+                             QColor(*MESSAGE_SHADOW_COLOR))
+        if self.outline:
+            painter.strokePath(path, QPen(QColor(*MESSAGE_OUTLINE_COLOR), MESSAGE_OUTLINE_WIDTH * 2))
+        painter.fillPath(path, QColor(*MESSAGE_TEXT_COLOR))
+        painter.end()
+        self._images[key] = image
+        if len(self._images) > self.IMAGE_CACHE_SIZE:
+            self._images.popitem(last=False)
+        return image
@@ -1,18 +1,157 @@
+import atexit
+import copy
+import fnmatch
 import json
 import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
 import sys
 
+from mute_streamer_overload.utils.config_schema import ConfigSnapshot, FIELD_TYPES, build_snapshot, validate
+
 logger = logging.getLogger(__name__)
 
+# Auto-save waits this long after a change so that bursts of set() calls
+# end up in a single write
+SAVE_DELAY = 0.5
+
+# Settings that belong to a named profile; the Twitch account, window
+# geometry and general options are shared by all profiles
+PROFILE_SECTIONS = ('overlay', 'animation', 'input', 'tts')
+DEFAULT_PROFILE = "Default"
+
+# Top-level keys whose value is handled as a whole rather than per dotted leaf
+OPAQUE_KEYS = frozenset(('profiles',))
+
+# How often the watcher checks profile.json for edits made outside the app
+WATCH_INTERVAL = 1.0
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write text to path via a temp file and rename, so readers never see a partial file."""
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def _flatten(config: Dict[str, Any], prefix: str = '') -> Dict[str, Any]:
+    """Map every leaf of a nested config dict to its dotted key path.
+    
+    The profiles section is kept as a single value: its keys are
+    user-chosen names that may contain dots.
+    """
+    flat = {}
+    for key, value in config.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value and path not in OPAQUE_KEYS:
+            flat.update(_flatten(value, f"{path}."))
+        else:
+            flat[path] = value
+    return flat
+
+
+def _file_signature(path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _unflatten(flat: Dict[str, Any]) -> Dict[str, Any]:
+    """Inverse of _flatten."""
+    config = {}
+    for key_path, value in flat.items():
+        *parents, leaf = key_path.split('.')
+        node = config
+        for key in parents:
+            node = node.setdefault(key, {})
+        node[leaf] = value
+    return config
+
+
+class ConfigKey:
+    """Precompiled accessor for one dotted config key.
+
+    The key path is split once, and the value is cached until the config
+    changes, so get() on a hot path is a single counter comparison.
+    """
+    __slots__ = ('manager', 'key_path', 'keys', 'default', '_cached')
+
+    def __init__(self, manager: 'ConfigManager', key_path: str, default: Any = None):
+        self.manager = manager
+        self.key_path = key_path
+        self.keys = tuple(key_path.split('.'))
+        self.default = default
+        self._cached = (-1, default)  # (version, value), replaced as one object
+
+    def get(self) -> Any:
+        version, value = self._cached
+        current = self.manager.version
+        if version != current:
+            # Read the version before the value: a change in between bumps
+            # it again and the next get() reads afresh
+            value = self.manager._get_path(self.keys, self.default)
+            self._cached = (current, value)
+        return value
+
+    def set(self, value: Any) -> None:
+        self.manager._set_path(self.keys, self.key_path, value)
+
+    def __repr__(self) -> str:
+        return f"ConfigKey({self.key_path!r}, default={self.default!r})"
+
+
 class ConfigManager:
-    """Manages application configuration and user preferences."""
+    """Manages application configuration and user preferences.
+    
+    With auto-save on, changes are written by a background thread once
+    they have stopped for SAVE_DELAY, coalescing bursts into one write;
+    transaction() defers the write until a whole group of changes is in.
+    Files are replaced atomically.
+    
+    Components that read settings often use key() accessors or subscribe
+    with on_change(pattern, callback) instead of calling get() every time.
+    Callbacks get (key_path, new_value) for every leaf that actually
+    changed, on the thread that made the change.
+    
+    start_watching() polls the file and applies edits made outside the
+    app (by hand or by a sync tool) without a restart; see reload_from_disk().
+    
+    snapshot() returns the whole config as immutable typed sections (see
+    config_schema), rebuilt only when the config has changed.
+    
+    Named profiles keep their own copy of PROFILE_SECTIONS under the
+    "profiles" key; switch_profile() applies only the keys that differ.
+    """
     
     def __init__(self):
         self.config_file = self._get_config_path()
         self.config = self._load_default_config()
+        self._lock = threading.RLock()
+        self._write_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._writer = None
+        # Monotonic time the debounced save waits for; pushed back by each change
+        self._save_deadline = 0.0
+        self._batch_depth = 0
+        self._last_written = None
+        # Bumped on every change; ConfigKey uses it to drop cached values
+        self.version = 0
+        self._subscribers = []  # (pattern, callback)
+        self._watcher = None
+        self._watch_stop = None
+        self._snapshot = None
         self.load_config()
+        # Build the first snapshot now so schema problems show up at startup
+        self.snapshot()
     
     def _get_config_path(self) -> Path:
         """Get the path to the configuration file."""
@@ -37,7 +176,9 @@ class ConfigManager:
                 "min_height": 100,
                 "start_visible": False,
                 "always_on_top": True,
-                "opacity": 0.9
+                "opacity": 0.9,
+                "text_shadow": True,
+                "text_outline": False
             },
             
             # Animation Settings
@@ -45,7 +186,13 @@ class ConfigManager:
                 "words_per_minute": 500,
                 "min_characters": 10,
                 "max_characters": 50,
-                "animation_delay_ms": 100
+                "animation_delay_ms": 100,
+                "queue_policy": "queue",
+                "queue_max_depth": 5,
+                "compress_queued_hold": True,
+                "fade_in_duration": 0.1,
+                "fade_out_delay": 1.0,
+                "fade_out_duration": 1.0
             },
             
             # Web Server Settings
@@ -68,12 +215,15 @@ class ConfigManager:
             "input": {
                 "start_hotkey": ["F4"],
                 "submit_hotkey": ["F4"],
-                "suppress_hotkey": False
+                "suppress_hotkey": False,
+                "live_preview": False
             },
             
             # General Settings
             "general": {
                 "auto_save_config": True,
+                "watch_config_file": True,
+                "active_profile": DEFAULT_PROFILE,
                 "log_level": "INFO",
                 "check_for_updates": True
             },
@@ -87,6 +237,7 @@ class ConfigManager:
                 "username": None,
                 "channel": None,
                 "display_name": None,
+                "user_id": None,
                 "send_messages": True,
                 "send_timing": "immediate"
             },
@@ -98,8 +249,14 @@ class ConfigManager:
                 "speed": 1.0,
                 "pitch": 1.0,
                 "volume": 1.0,
-                "sync_with_text": True
-            }
+                "sync_with_text": True,
+                "sync_overlay_wpm_with_tts": True,
+                "speculative_synthesis": True,
+                "speculative_delay_ms": 400
+            },
+            
+            # Named profiles: name -> copy of PROFILE_SECTIONS
+            "profiles": {}
         }
     
     def load_config(self) -> None:
@@ -107,10 +264,15 @@ class ConfigManager:
         try:
             if self.config_file.exists():
                 with open(self.config_file, 'r', encoding='utf-8') as f:
-                    file_config = json.load(f)
+                    text = f.read()
+                file_config = json.loads(text)
+                self._last_written = text
                 
-                # Merge file config with defaults (deep merge)
-                self._merge_configs(self.config, file_config)
+                # Merge file config with defaults (deep merge), leaving out invalid values
+                if not isinstance(file_config, dict):
+                    raise ValueError("expected a JSON object")
+                with self._replacing_config():
+                    self._merge_configs(self.config, _unflatten(self._validate(file_config)))
                 logger.info(f"Configuration loaded from {self.config_file}")
             else:
                 logger.info("No configuration file found, using defaults")
@@ -121,14 +283,300 @@ class ConfigManager:
             logger.info("Using default configuration")
     
     def save_config(self) -> None:
-        """Save current configuration to file."""
+        """Save current configuration to file now (deferred to the end of a transaction)."""
+        # Serialize and write under one lock so concurrent saves land in order
+        with self._write_lock:
+            with self._lock:
+                if self._batch_depth:
+                    self._dirty.set()
+                    return
+                self._dirty.clear()
+                text = json.dumps(self.config, indent=2, ensure_ascii=False)
+            self._write(text)
+    
+    def flush(self) -> None:
+        """Write pending auto-save changes immediately, if there are any."""
+        if self._dirty.is_set():
+            self.save_config()
+    
+    @contextmanager
+    def transaction(self):
+        """Group several set() calls into a single save once the outermost block exits."""
+        with self._lock:
+            self._batch_depth += 1
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                pending = self._batch_depth == 0 and self._dirty.is_set()
+            if pending:
+                self._schedule_save()
+    
+    def update(self, values: Dict[str, Any]) -> None:
+        """Set several dotted keys at once with a single save."""
+        with self.transaction():
+            for key_path, value in values.items():
+                self.set(key_path, value)
+    
+    def _write(self, text: str) -> None:
+        """Write text to the config file. Call with _write_lock held."""
+        if text == self._last_written:
+            return
+        # Set before the file appears so the watcher recognises its own write
+        previous, self._last_written = self._last_written, text
+        try:
+            _write_atomic(self.config_file, text)
             logger.info(f"Configuration saved to {self.config_file}")
         except Exception as e:
+            self._last_written = previous
             logger.error(f"Failed to save configuration: {e}")
     
+    def _schedule_save(self) -> None:
+        with self._lock:
+            self._save_deadline = time.monotonic() + SAVE_DELAY
+            self._dirty.set()
+            if self._batch_depth:
+                return
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(target=self._run_writer, name="ConfigWriter", daemon=True)
+                self._writer.start()
+    
+    def _run_writer(self) -> None:
+        while True:
+            self._dirty.wait()
+            # Wait until changes have been quiet for SAVE_DELAY
+            while True:
+                with self._lock:
+                    remaining = self._save_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                time.sleep(remaining)
+            with self._lock:
+                if self._batch_depth:
+                    # The transaction schedules its own save when it ends
+                    self._save_deadline = time.monotonic() + SAVE_DELAY
+                    continue
+            self.flush()
+    
+    def start_watching(self, on_reload: Optional[Callable[[list], None]] = None,
+                       interval: float = WATCH_INTERVAL) -> None:
+        """Poll the config file and apply external edits as they appear.
+        
+        on_reload(changed_keys) is called from the watcher thread after a
+        reload changed anything, in addition to the on_change() callbacks.
+        """
+        with self._lock:
+            if self._watcher is not None:
+                return
+            stop = self._watch_stop = threading.Event()
+            self._watcher = threading.Thread(target=self._run_watcher, args=(stop, interval, on_reload),
+                                             name="ConfigWatcher", daemon=True)
+            self._watcher.start()
+    
+    def stop_watching(self) -> None:
+        with self._lock:
+            if self._watcher is not None:
+                self._watch_stop.set()
+                self._watcher = None
+    
+    def _run_watcher(self, stop: threading.Event, interval: float, on_reload) -> None:
+        signature = _file_signature(self.config_file)
+        while not stop.wait(interval):
+            current = _file_signature(self.config_file)
+            if current is None or current == signature:
+                continue
+            signature = current
+            changed = self.reload_from_disk()
+            if changed and on_reload is not None and not stop.is_set():
+                try:
+                    on_reload(changed)
+                except Exception as e:
+                    logger.error(f"Config reload callback failed: {e}")
+    
+    def reload_from_disk(self) -> list:
+        """Apply changes made to the config file outside the app; returns the changed keys.
+        
+        The file is diffed against what was last loaded or saved, so only
+        keys edited externally are applied and unsaved changes to other keys
+        survive. Values that don't fit the schema are rejected with a warning.
+        """
+        with self._write_lock:
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    text = f.read()
+            except OSError as e:
+                logger.warning(f"Could not read {self.config_file}: {e}")
+                return []
+            if text == self._last_written:
+                return []
+            try:
+                file_config = json.loads(text)
+            except ValueError as e:
+                # Often an editor mid-save; the next change to the file retries
+                logger.warning(f"Ignoring {self.config_file}: invalid JSON ({e})")
+                return []
+            if not isinstance(file_config, dict):
+                logger.warning(f"Ignoring {self.config_file}: expected a JSON object")
+                return []
+            baseline = {}
+            if self._last_written is not None:
+                try:
+                    baseline = _flatten(json.loads(self._last_written))
+                except ValueError:
+                    pass
+            self._last_written = text
+        
+        missing = object()
+        edited = {key: value for key, value in self._validate(file_config).items()
+                  if baseline.get(key, missing) != value}
+        changes = []
+        with self._lock:
+            for key_path, value in edited.items():
+                keys = key_path.split('.')
+                if self._get_path(keys, missing) != value:
+                    self._assign(keys, value)
+                    changes.append((key_path, value))
+            if changes:
+                self.version += 1
+        if changes:
+            logger.info(f"Configuration reloaded from {self.config_file}: "
+                        f"{', '.join(key for key, _ in changes)}")
+            self._notify(changes)
+        return [key for key, _ in changes]
+    
+    def _validate(self, file_config: Dict[str, Any]) -> Dict[str, Any]:
+        """Flatten file_config, dropping values that don't fit the schema.
+        
+        Keys the schema doesn't know are kept as they are.
+        """
+        flat = _flatten(file_config)
+        errors = validate(flat)
+        for key_path, error in errors.items():
+            logger.warning(f"Ignoring invalid config value: {error}")
+            del flat[key_path]
+        return flat
+    
+    def snapshot(self) -> ConfigSnapshot:
+        """Immutable, typed view of the current config, cached per config version."""
+        snapshot = self._snapshot
+        if snapshot is None or snapshot.version != self.version:
+            with self._lock:
+                snapshot = self._snapshot = build_snapshot(self.config, self._load_default_config(), self.version)
+        return snapshot
+    
+    def active_profile(self) -> str:
+        return self.get('general.active_profile', DEFAULT_PROFILE)
+    
+    def list_profiles(self) -> list:
+        """Names of all saved profiles, including the active one."""
+        with self._lock:
+            names = set(self.config.get('profiles') or {})
+        names.add(self.active_profile())
+        return sorted(names, key=str.lower)
+    
+    def save_profile(self, name: Optional[str] = None) -> None:
+        """Store the current profile settings under name (the active profile by default)."""
+        with self._lock:
+            self._store_profile(name or self.active_profile())
+            self.version += 1
+        if self.get('general.auto_save_config', True):
+            self._schedule_save()
+    
+    def delete_profile(self, name: str) -> None:
+        if name == self.active_profile():
+            raise ValueError("The active profile can't be deleted")
+        with self._lock:
+            if (self.config.get('profiles') or {}).pop(name, None) is None:
+                return
+            self.version += 1
+        if self.get('general.auto_save_config', True):
+            self._schedule_save()
+    
+    def switch_profile(self, name: str) -> list:
+        """Make name the active profile and return the keys whose values changed.
+        
+        The current settings are stored in the profile being left first, so
+        nothing edited under it is lost. Only keys that differ between the
+        two profiles are assigned and reported to on_change() subscribers.
+        """
+        missing = object()
+        with self._lock:
+            current = self.active_profile()
+            if name == current:
+                return []
+            profile = (self.config.get('profiles') or {}).get(name)
+            if profile is None:
+                raise KeyError(f"Unknown profile: {name}")
+            self._store_profile(current)
+            target = self._validate({section: profile[section]
+                                     for section in PROFILE_SECTIONS if section in profile})
+            changes = []
+            for key_path, value in target.items():
+                keys = key_path.split('.')
+                if self._get_path(keys, missing) != value:
+                    self._assign(keys, copy.deepcopy(value))
+                    changes.append((key_path, value))
+            self._assign(('general', 'active_profile'), name)
+            self.version += 1
+        logger.info(f"Switched profile {current!r} -> {name!r}, {len(changes)} setting(s) changed")
+        self._notify(changes + [('general.active_profile', name)])
+        if self.get('general.auto_save_config', True):
+            self._schedule_save()
+        return [key for key, _ in changes]
+    
+    def _store_profile(self, name: str) -> None:
+        # Call with _lock held
+        profiles = self.config.setdefault('profiles', {})
+        profiles[name] = {section: copy.deepcopy(self.config.get(section, {})) for section in PROFILE_SECTIONS}
+    
+    def on_change(self, pattern: str, callback: Callable[[str, Any], None]) -> Callable[[], None]:
+        """Call callback(key_path, value) whenever a key matching pattern changes.
+        
+        pattern is a dotted key or a glob such as "tts.*" or "*". Returns a
+        function that removes the subscription.
+        """
+        entry = (pattern, callback)
+        with self._lock:
+            self._subscribers = self._subscribers + [entry]
+        
+        def unsubscribe():
+            with self._lock:
+                self._subscribers = [s for s in self._subscribers if s is not entry]
+        return unsubscribe
+    
+    def key(self, key_path: str, default: Any = None) -> ConfigKey:
+        """Precompiled accessor for key_path; raises KeyError for keys the schema doesn't define."""
+        if key_path not in FIELD_TYPES:
+            raise KeyError(f"Unknown config key: {key_path}")
+        return ConfigKey(self, key_path, default)
+    
+    def _notify(self, changes: Iterable[Tuple[str, Any]]) -> None:
+        subscribers = self._subscribers
+        if not subscribers:
+            return
+        for key_path, value in changes:
+            for pattern, callback in subscribers:
+                if pattern == key_path or fnmatch.fnmatchcase(key_path, pattern):
+                    try:
+                        callback(key_path, value)
+                    except Exception as e:
+                        logger.error(f"Config change callback for {key_path} failed: {e}")
+    
+    @contextmanager
+    def _replacing_config(self):
+        """Wrap a bulk change to self.config and notify about every leaf that differs afterwards."""
+        with self._lock:
+            before = _flatten(self.config)
+            yield
+            after = _flatten(self.config)
+            self.version += 1
+        changes = [(key, value) for key, value in after.items()
+                   if key not in before or before[key] != value]
+        # Keys that no longer exist are reported with None
+        changes.extend((key, None) for key in before if key not in after)
+        self._notify(changes)
+    
     def _merge_configs(self, default: Dict[str, Any], override: Dict[str, Any]) -> None:
         """Recursively merge configuration dictionaries."""
         for key, value in override.items():
@@ -139,9 +587,10 @@ class ConfigManager:
     
     def get(self, key_path: str, default: Any = None) -> Any:
         """Get a configuration value using dot notation (e.g., 'overlay.initial_width')."""
-        keys = key_path.split('.')
+        return self._get_path(key_path.split('.'), default)
+    
+    def _get_path(self, keys, default: Any = None) -> Any:
         value = self.config
-        
         try:
             for key in keys:
                 value = value[key]
@@ -151,7 +600,22 @@ class ConfigManager:
     
     def set(self, key_path: str, value: Any) -> None:
         """Set a configuration value using dot notation."""
-        keys = key_path.split('.')
+        self._set_path(key_path.split('.'), key_path, value)
+    
+    def _set_path(self, keys, key_path: str, value: Any) -> None:
+        with self._lock:
+            if not self._assign(keys, value):
+                return
+            self.version += 1
+        
+        self._notify([(key_path, value)])
+        
+        # Auto-save (debounced) if enabled
+        if self.get('general.auto_save_config', True):
+            self._schedule_save()
+    
+    def _assign(self, keys, value: Any) -> bool:
+        """Store value at keys; False if it was already there. Call with _lock held."""
         config = self.config
         
         # Navigate to the parent of the target key
@@ -160,16 +624,20 @@ class ConfigManager:
                 config[key] = {}
             config = config[key]
         
+        if keys[-1] in config and config[keys[-1]] == value:
+            return False
         # Set the value
         config[keys[-1]] = value
-        
-        # Auto-save if enabled
-        if self.get('general.auto_save_config', True):
-            self.save_config()
+        return True
     
     def reset_to_defaults(self) -> None:
         """Reset configuration to default values."""
-        self.config = self._load_default_config()
+        with self._replacing_config():
+            # Saved profiles are kept; only the live settings go back to defaults
+            profiles, active = self.config.get('profiles', {}), self.active_profile()
+            self.config = self._load_default_config()
+            self.config['profiles'] = profiles
+            self.config['general']['active_profile'] = active
         self.save_config()
         logger.info("Configuration reset to defaults")
     
@@ -180,8 +648,9 @@ class ConfigManager:
     def export_config(self, export_path: Path) -> None:
         """Export current configuration to a specified path."""
         try:
-            with open(export_path, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2, ensure_ascii=False)
+            with self._lock:
+                text = json.dumps(self.config, indent=2, ensure_ascii=False)
+            _write_atomic(Path(export_path), text)
             logger.info(f"Configuration exported to {export_path}")
         except Exception as e:
             logger.error(f"Failed to export configuration: {e}")
@@ -192,9 +661,11 @@ class ConfigManager:
             with open(import_path, 'r', encoding='utf-8') as f:
                 imported_config = json.load(f)
             
-            # Validate the imported config structure
+            # Validate the imported config structure; values that don't fit
+            # the schema are dropped, the same as when profile.json is loaded
             if isinstance(imported_config, dict):
-                self._merge_configs(self.config, imported_config)
+                with self._replacing_config():
+                    self._merge_configs(self.config, _unflatten(self._validate(imported_config)))
                 self.save_config()
                 logger.info(f"Configuration imported from {import_path}")
             else:
@@ -204,6 +675,8 @@ class ConfigManager:
 
 # Global configuration instance
 config_manager = ConfigManager()
+# Don't lose a pending debounced save on exit
+atexit.register(config_manager.flush)
 
 # Convenience functions for common operations
 def get_config(key_path: str, default: Any = None) -> Any:
@@ -218,12 +691,57 @@ def save_config() -> None:
     """Save the current configuration."""
     config_manager.save_config()
 
+def update_config(values: Dict[str, Any]) -> None:
+    """Set several configuration values with a single save."""
+    config_manager.update(values)
+
+def config_transaction():
+    """Context manager batching every set_config() inside it into one save."""
+    return config_manager.transaction()
+
+def config_key(key_path: str, default: Any = None) -> ConfigKey:
+    """Precompiled, cached accessor for a configuration value."""
+    return config_manager.key(key_path, default)
+
+def on_change(pattern: str, callback: Callable[[str, Any], None]) -> Callable[[], None]:
+    """Subscribe to changes of keys matching pattern (e.g. "tts.*"); returns an unsubscribe function."""
+    return config_manager.on_change(pattern, callback)
+
+def config_snapshot() -> ConfigSnapshot:
+    """Current configuration as immutable typed sections, e.g. config_snapshot().tts.speed."""
+    return config_manager.snapshot()
+
+def list_profiles() -> list:
+    """Names of the saved configuration profiles."""
+    return config_manager.list_profiles()
+
+def active_profile() -> str:
+    return config_manager.active_profile()
+
+def save_profile(name: Optional[str] = None) -> None:
+    """Save the current settings as profile name (the active profile by default)."""
+    config_manager.save_profile(name)
+
+def switch_profile(name: str) -> list:
+    """Switch to profile name; returns the keys whose values changed."""
+    return config_manager.switch_profile(name)
+
+def delete_profile(name: str) -> None:
+    config_manager.delete_profile(name)
+
+def watch_config(on_reload: Optional[Callable[[list], None]] = None) -> None:
+    """Start applying external edits of the config file; on_reload gets the changed keys."""
+    config_manager.start_watching(on_reload)
+
+def stop_watching_config() -> None:
+    config_manager.stop_watching()
+
 def reset_config() -> None:
     """Reset configuration to defaults."""
     config_manager.reset_to_defaults()
 
 # --- New: Auto-update WPM in config when TTS speed changes ---
 def auto_update_wpm_for_tts_speed(speed: float):
+    # Debounced auto-save; no write at all when the speed hasn't changed
     wpm = int(500 * speed)
-    set_config('animation.words_per_minute', wpm)
-    save_config() 
\ No newline at end of file
+    set_config('animation.words_per_minute', wpm) 
\ No newline at end of file
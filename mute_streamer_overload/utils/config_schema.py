@@ -0,0 +1,176 @@
+"""Typed schema for the configuration and the immutable snapshots built from it.
+
+Each section of profile.json is a NamedTuple, so a snapshot is compact,
+read-only and uses plain attribute access (snapshot.tts.speed). The
+annotations double as the validation rules for values read from disk.
+Default values stay in ConfigManager._load_default_config().
+"""
+import logging
+from typing import Any, Dict, Literal, NamedTuple, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+
+class OverlayConfig(NamedTuple):
+    initial_width: int
+    initial_height: int
+    min_width: int
+    min_height: int
+    start_visible: bool
+    always_on_top: bool
+    opacity: float
+    text_shadow: bool
+    text_outline: bool
+
+
+class AnimationConfig(NamedTuple):
+    words_per_minute: int
+    min_characters: int
+    max_characters: int
+    animation_delay_ms: int
+    queue_policy: Literal["queue", "replace", "merge"]
+    queue_max_depth: int
+    compress_queued_hold: bool
+    fade_in_duration: float
+    fade_out_delay: float
+    fade_out_duration: float
+
+
+class WebServerConfig(NamedTuple):
+    host: str
+    port: int
+    auto_start: bool
+
+
+class UIConfig(NamedTuple):
+    theme: str
+    window_width: int
+    window_height: int
+    window_x: Optional[int]
+    window_y: Optional[int]
+
+
+class InputConfig(NamedTuple):
+    start_hotkey: Tuple[str, ...]
+    submit_hotkey: Tuple[str, ...]
+    suppress_hotkey: bool
+    live_preview: bool
+
+
+class GeneralConfig(NamedTuple):
+    auto_save_config: bool
+    watch_config_file: bool
+    active_profile: str
+    log_level: str
+    check_for_updates: bool
+
+
+class TwitchConfig(NamedTuple):
+    client_id: Optional[str]
+    client_secret: Optional[str]
+    access_token: Optional[str]
+    refresh_token: Optional[str]
+    username: Optional[str]
+    channel: Optional[str]
+    display_name: Optional[str]
+    user_id: Optional[str]
+    send_messages: bool
+    send_timing: Literal["immediate", "after_animation"]
+
+
+class TTSConfig(NamedTuple):
+    enabled: bool
+    voice: str
+    speed: float
+    pitch: float
+    volume: float
+    sync_with_text: bool
+    sync_overlay_wpm_with_tts: bool
+    speculative_synthesis: bool
+    speculative_delay_ms: int
+
+
+class ConfigSnapshot(NamedTuple):
+    """The whole configuration at one ConfigManager.version."""
+    version: int
+    overlay: OverlayConfig
+    animation: AnimationConfig
+    web_server: WebServerConfig
+    ui: UIConfig
+    input: InputConfig
+    general: GeneralConfig
+    twitch: TwitchConfig
+    tts: TTSConfig
+
+
+SECTIONS = {name: ConfigSnapshot.__annotations__[name] for name in ConfigSnapshot._fields[1:]}
+
+# "section.field" -> annotation, for every key the schema knows about
+FIELD_TYPES = {f"{section}.{field}": annotation
+               for section, cls in SECTIONS.items()
+               for field, annotation in cls.__annotations__.items()}
+
+
+def _type_args(annotation):
+    return getattr(annotation, '__args__', ())
+
+
+def check_type(annotation, value: Any) -> bool:
+    """Whether value (as loaded from JSON) fits a schema annotation."""
+    origin = getattr(annotation, '__origin__', None)
+    if origin is Union:
+        return any(check_type(arg, value) for arg in _type_args(annotation))
+    if origin is Literal:
+        return value in _type_args(annotation)
+    if origin in (tuple, Tuple):
+        item = _type_args(annotation)[0]
+        return isinstance(value, (list, tuple)) and all(check_type(item, v) for v in value)
+    if annotation is type(None):
+        return value is None
+    if annotation is bool:
+        return isinstance(value, bool)
+    if isinstance(value, bool):
+        return False
+    if annotation is float:
+        return isinstance(value, (int, float))
+    return isinstance(value, annotation)
+
+
+def validate(flat: Dict[str, Any]) -> Dict[str, str]:
+    """Map each key of a flattened config whose value doesn't fit the schema to an error message."""
+    errors = {}
+    for key_path, value in flat.items():
+        annotation = FIELD_TYPES.get(key_path)
+        if annotation is not None:
+            if not check_type(annotation, value):
+                if getattr(annotation, '__origin__', None) is Literal:
+                    expected = f"one of {', '.join(map(repr, _type_args(annotation)))}"
+                else:
+                    name = annotation.__name__ if isinstance(annotation, type) else str(annotation).replace('typing.', '')
+                    expected = f"a valid {name}"
+                errors[key_path] = f"{key_path}={value!r} is not {expected}"
+        elif key_path in SECTIONS:
+            errors[key_path] = f"{key_path} must be an object, got {value!r}"
+    return errors
+
+
+def _freeze(value: Any) -> Any:
+    return tuple(value) if isinstance(value, list) else value
+
+
+def build_snapshot(config: Dict[str, Any], defaults: Dict[str, Any], version: int) -> ConfigSnapshot:
+    """Build an immutable snapshot of config; invalid values fall back to the defaults."""
+    sections = {}
+    for section, cls in SECTIONS.items():
+        values = config.get(section)
+        if not isinstance(values, dict):
+            values = {}
+        fields = {}
+        for field, annotation in cls.__annotations__.items():
+            value = values.get(field, defaults[section][field])
+            if not check_type(annotation, value):
+                logger.warning(f"Invalid config value {section}.{field}={value!r}, using default")
+                value = defaults[section][field]
+            fields[field] = _freeze(value)
+        sections[section] = cls(**fields)
+    return ConfigSnapshot(version=version, **sections)
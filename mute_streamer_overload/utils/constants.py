@@ -145,14 +145,12 @@ CLOSE_BUTTON_STYLE = """
     }
 """
 
-MESSAGE_LABEL_STYLE = """
-    QLabel {
-        color: white;
-        font-size: 24px;
-        font-weight: bold;
-        background-color: transparent;
-    }
-"""
+# Overlay text rendering (RGBA)
+MESSAGE_TEXT_COLOR = (255, 255, 255, 255)
+MESSAGE_SHADOW_COLOR = (0, 0, 0, 204)
+MESSAGE_OUTLINE_COLOR = (0, 0, 0, 255)
+MESSAGE_SHADOW_OFFSET = 2
+MESSAGE_OUTLINE_WIDTH = 2
 
 CONTENT_WIDGET_STYLE = """
     QWidget {
@@ -0,0 +1,167 @@
+import mmap
+import os
+import struct
+import tempfile
+import weakref
+from pathlib import Path
+
+# Header: magic, version, width, height, stride, slot count, latest sequence number.
+# Each slot starts with its own sequence number followed by the RGBA pixels.
+MAGIC = b'MSOF'
+VERSION = 1
+HEADER = struct.Struct('<4sIIIIIQ')
+SLOT_HEADER = struct.Struct('<Q')
+HEADER_SIZE = 64
+SLOT_HEADER_SIZE = 64
+BYTES_PER_PIXEL = 4
+DEFAULT_SLOTS = 3
+
+
+def default_buffer_path():
+    """Shared-memory backed path when available (/dev/shm), else the temp directory"""
+    shm = Path('/dev/shm')
+    base = shm if shm.is_dir() else Path(tempfile.gettempdir())
+    return base / 'mute_streamer_overload.frames'
+
+
+def _slot_offset(slot, stride, height):
+    return HEADER_SIZE + slot * (SLOT_HEADER_SIZE + stride * height)
+
+
+class FrameRingBuffer:
+    """Writer side of a memory-mapped ring of RGBA frames.
+
+    Frame n (counting from 1) goes into slot n % slots. A slot's sequence
+    number is zeroed while its pixels are written and set to n afterwards;
+    the header's sequence number is bumped last, so a reader never sees a
+    frame announced before it is complete.
+
+    An existing buffer with the same layout is reused in place and its
+    sequence numbers carry on, so readers that stay attached across a
+    writer restart keep working. Otherwise a new file is renamed over the
+    old one; it is never truncated, which would crash (SIGBUS) readers
+    that still have it mapped.
+    """
+
+    def __init__(self, path, width, height, slots=DEFAULT_SLOTS):
+        self.path = Path(path)
+        self.width = width
+        self.height = height
+        self.stride = width * BYTES_PER_PIXEL
+        self.slots = slots
+        self.seq = 0
+        size = _slot_offset(slots, self.stride, height)
+        if not self._reuse(size):
+            tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp_path, 'wb') as f:
+                f.truncate(size)
+            os.replace(tmp_path, self.path)
+            self._file = open(self.path, 'r+b')
+            self._mmap = mmap.mmap(self._file.fileno(), size)
+        self._write_header()
+
+    def _reuse(self, size):
+        """Map an existing buffer with this exact layout; False if there is none"""
+        try:
+            if os.path.getsize(self.path) != size:
+                return False
+            self._file = open(self.path, 'r+b')
+        except OSError:
+            return False
+        self._mmap = mmap.mmap(self._file.fileno(), size)
+        magic, version, width, height, stride, slots, seq = HEADER.unpack_from(self._mmap, 0)
+        if (magic, version, width, height, stride, slots) != (MAGIC, VERSION, self.width, self.height,
+                                                               self.stride, self.slots):
+            self._mmap.close()
+            self._file.close()
+            return False
+        self.seq = seq
+        return True
+
+    def _write_header(self):
+        HEADER.pack_into(self._mmap, 0, MAGIC, VERSION, self.width, self.height,
+                         self.stride, self.slots, self.seq)
+
+    def publish(self, pixels):
+        """Copy one frame (stride * height bytes, RGBA) into the next slot; returns its sequence number"""
+        seq = self.seq + 1
+        offset = _slot_offset(seq % self.slots, self.stride, self.height)
+        start = offset + SLOT_HEADER_SIZE
+        SLOT_HEADER.pack_into(self._mmap, offset, 0)
+        self._mmap[start:start + self.stride * self.height] = pixels
+        SLOT_HEADER.pack_into(self._mmap, offset, seq)
+        self.seq = seq
+        self._write_header()
+        return seq
+
+    def close(self, unlink=False):
+        self._mmap.close()
+        self._file.close()
+        if unlink:
+            try:
+                os.unlink(self.path)
+            except OSError:
+                pass
+
+
+class FrameRingReader:
+    """Reader side: maps the buffer and hands out zero-copy views of the latest frame"""
+
+    def __init__(self, path):
+        self._file = open(path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.width, self.height, self.stride, self.slots, _ = \
+            HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} overlay frame buffer")
+        self._view = memoryview(self._mmap)
+        # Weak references to the views handed out by latest(); the mapping
+        # can't be closed while one of them is alive
+        self._frames = []
+
+    def latest_seq(self):
+        return HEADER.unpack_from(self._mmap, 0)[-1]
+
+    def latest(self):
+        """Return (seq, pixels) for the newest complete frame, or (0, None) if there is none.
+
+        pixels is a memoryview straight into the mapping; check
+        is_current(seq) after using it to make sure the writer hasn't
+        recycled the slot in the meantime. close() releases it; copy it
+        with bytes() to keep the pixels longer.
+        """
+        seq = self.latest_seq()
+        if seq == 0:
+            return 0, None
+        offset = _slot_offset(seq % self.slots, self.stride, self.height)
+        if SLOT_HEADER.unpack_from(self._mmap, offset)[0] != seq:
+            return 0, None
+        start = offset + SLOT_HEADER_SIZE
+        pixels = self._view[start:start + self.stride * self.height]
+        self._frames = [ref for ref in self._frames if ref() is not None]
+        self._frames.append(weakref.ref(pixels))
+        return seq, pixels
+
+    def is_current(self, seq):
+        """True while frame seq is still intact in its slot"""
+        offset = _slot_offset(seq % self.slots, self.stride, self.height)
+        return SLOT_HEADER.unpack_from(self._mmap, offset)[0] == seq
+
+    def close(self):
+        """Unmap the buffer; views returned by latest() can't be used afterwards"""
+        for ref in self._frames:
+            pixels = ref()
+            if pixels is None:
+                continue
+            try:
+                pixels.release()
+            except BufferError:
+                pass  # Something still exports a buffer from this view
+        self._frames = []
+        self._view.release()
+        try:
+            self._mmap.close()
+        except BufferError:
+            # The mapping goes away once that last export is released
+            pass
+        self._file.close()
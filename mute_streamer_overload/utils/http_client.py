@@ -0,0 +1,141 @@
+"""Shared HTTP sessions for Twitch and for calls to our own web server.
+
+Every request goes through a requests.Session, so connections (and TLS
+handshakes) are reused per host instead of being opened for each call.
+Requests get a default timeout and a retry policy, and each host's
+latency is recorded; see latency_stats().
+"""
+import logging
+import threading
+import time
+from collections import deque
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts in seconds
+DEFAULT_TIMEOUT = (3.05, 10)
+LOOPBACK_TIMEOUT = (0.5, 2)
+
+# Samples kept per host for the latency percentiles
+STATS_WINDOW = 200
+
+LOOPBACK_HOSTS = frozenset(('127.0.0.1', 'localhost', '::1'))
+
+
+def _retry_policy():
+    # Failed connects are always safe to retry. Read errors and 5xx/429
+    # responses only for idempotent methods, so a chat message that reached
+    # Twitch is never posted twice.
+    return Retry(total=2, connect=2, read=1, status=2, backoff_factor=0.25,
+                 status_forcelist=(429, 500, 502, 503, 504),
+                 allowed_methods=frozenset(('GET', 'HEAD', 'OPTIONS')),
+                 respect_retry_after_header=True, raise_on_status=False)
+
+
+class HostStats:
+    """Request count, failures and recent latencies for one host."""
+    __slots__ = ('requests', 'errors', 'total', 'samples')
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.total = 0.0
+        self.samples = deque(maxlen=STATS_WINDOW)
+
+    def summary(self):
+        ordered = sorted(self.samples)
+
+        def pct(p):
+            return round(ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))] * 1000, 2) if ordered else None
+
+        return {
+            'requests': self.requests,
+            'errors': self.errors,
+            'mean_ms': round(self.total / self.requests * 1000, 2) if self.requests else None,
+            'p50_ms': pct(50),
+            'p95_ms': pct(95),
+            'max_ms': round(ordered[-1] * 1000, 2) if ordered else None,
+        }
+
+
+class HttpClient:
+    """Pooled keep-alive sessions: one for remote APIs, one for loopback calls.
+
+    Loopback calls get short timeouts and no retries; they only notify the
+    local overlay server and must never stall the caller.
+    """
+
+    def __init__(self, pool_size=4):
+        self._remote = self._make_session(pool_size, _retry_policy())
+        self._loopback = self._make_session(pool_size, Retry(total=0, raise_on_status=False))
+        self._stats = {}
+        self._stats_lock = threading.Lock()
+
+    @staticmethod
+    def _make_session(pool_size, retries):
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retries)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def request(self, method, url, **kwargs):
+        host = urlsplit(url).hostname or ''
+        loopback = host in LOOPBACK_HOSTS
+        kwargs.setdefault('timeout', LOOPBACK_TIMEOUT if loopback else DEFAULT_TIMEOUT)
+        session = self._loopback if loopback else self._remote
+        start = time.perf_counter()
+        ok = False
+        try:
+            response = session.request(method, url, **kwargs)
+            ok = response.status_code < 500
+            return response
+        finally:
+            self._record(host, time.perf_counter() - start, ok)
+
+    def get(self, url, **kwargs):
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request('POST', url, **kwargs)
+
+    def _record(self, host, elapsed, ok):
+        with self._stats_lock:
+            stats = self._stats.get(host)
+            if stats is None:
+                stats = self._stats[host] = HostStats()
+            stats.requests += 1
+            stats.total += elapsed
+            stats.samples.append(elapsed)
+            if not ok:
+                stats.errors += 1
+
+    def latency_stats(self):
+        """Per-host request counts and latencies in milliseconds."""
+        with self._stats_lock:
+            return {host: stats.summary() for host, stats in self._stats.items()}
+
+    def close(self):
+        self._remote.close()
+        self._loopback.close()
+
+
+# Shared instance; use the module functions below
+http_client = HttpClient()
+
+
+def get(url, **kwargs):
+    return http_client.get(url, **kwargs)
+
+
+def post(url, **kwargs):
+    return http_client.post(url, **kwargs)
+
+
+def latency_stats():
+    return http_client.latency_stats()
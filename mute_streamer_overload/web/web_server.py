@@ -3,12 +3,16 @@ import logging
 from pathlib import Path
 import threading
 import time
-import re
+from collections import deque
 from flask import Flask, render_template, request, jsonify
+from werkzeug.serving import WSGIRequestHandler
 # Remove Flask-SocketIO import
 import multiprocessing
 
 from mute_streamer_overload.utils.config import get_config
+from mute_streamer_overload.utils.http_client import latency_stats
+from mute_streamer_overload.core.chunk_layout import layout_chunks
+from mute_streamer_overload.core.timeline import TimelinePlayer
 
 # --- Logging Setup ---
 logger = logging.getLogger(__name__)
@@ -24,6 +28,14 @@ current_display_text = ""
 last_update_time = 0
 animation_active = False
 
+# Live typing preview: the text so far plus a short history of (seq, keep, insert)
+# deltas, so pollers only download what changed since their last request
+PREVIEW_HISTORY = 64
+preview_text = ""
+preview_seq = 0
+preview_deltas = deque(maxlen=PREVIEW_HISTORY)
+preview_lock = threading.Lock()
+
 # --- Path Configuration ---
 def get_project_root():
     """
@@ -43,10 +55,16 @@ static_dir = project_root / 'mute_streamer_overload' / 'web' / 'static'
 
 # --- Web Text Animator ---
 class WebTextAnimator:
-    def __init__(self):
+    def __init__(self, scheduler=None):
         self.current_message = ""
-        self.animation_thread = None
-        self._stop_animation_flag = False
+        # Keep the final sentence up for 1 second before fading out
+        self.player = TimelinePlayer(self._layout, self._show_frame, self._finish,
+                                     on_start=self._on_timeline_started, hold=1.0, name="WEB ANIMATOR",
+                                     scheduler=scheduler)
+        self.player.set_queue_policy(get_config("animation.queue_policy", "queue"),
+                                     get_config("animation.queue_max_depth", 5),
+                                     get_config("animation.compress_queued_hold", True))
+        self._lock = threading.Lock()
         self.settings = {
             'wpm': get_config("animation.words_per_minute", 500),
             'min_chars': get_config("animation.min_characters", 10),
@@ -54,104 +72,72 @@ class WebTextAnimator:
         }
 
     def update_settings(self, wpm=None, min_chars=None, max_chars=None):
+        """Update settings and hot-apply them to the animation in flight"""
+        limits = (self.settings['min_chars'], self.settings['max_chars'])
         if wpm is not None: self.settings['wpm'] = wpm
         if min_chars is not None: self.settings['min_chars'] = min_chars
         if max_chars is not None: self.settings['max_chars'] = max_chars
+        if wpm is not None:
+            self.player.set_interval(60.0 / self.settings['wpm'])
+        if limits != (self.settings['min_chars'], self.settings['max_chars']):
+            self.player.relayout()
 
-    def _get_next_words(self, words, current_index):
-        if current_index >= len(words):
-            return [], current_index
-        result, char_count, i = [], 0, current_index
-        while i < len(words):
-            word = words[i]
-            if char_count + len(word) + len(result) > self.settings['max_chars'] and result:
-                break
-            result.append(word)
-            char_count += len(word)
-            i += 1
-            if char_count >= self.settings['min_chars']:
-                break
-        return result, i
-
-    def start_animation(self, message):
-        global animation_in_progress, current_display_text, last_update_time, animation_active
+    def start_animation(self, message, wpm=None):
+        """Play message; wpm, if given, sets the speed for this message only"""
+        global animation_in_progress, animation_active
         print(f"[WEB ANIMATOR] start_animation called with: '{message}'")
-        
-        # Prevent duplicate animations
-        if animation_in_progress:
-            print(f"[WEB ANIMATOR] Animation already in progress, skipping")
-            return
-            
-        animation_in_progress = True
-        animation_active = True
-        print(f"[WEB ANIMATOR] Starting new animation")
-        
-        if self.animation_thread and self.animation_thread.is_alive():
-            print(f"[WEB ANIMATOR] Stopping existing animation")
-            self._stop_animation_flag = True
-            self.animation_thread.join()
-        self.current_message = message
-        self._stop_animation_flag = False
-        self.animation_thread = threading.Thread(target=self._animate_text, daemon=True)
-        self.animation_thread.start()
-        print(f"[WEB ANIMATOR] Animation thread started")
-
-    def _animate_text(self):
-        global current_display_text, last_update_time, animation_active
-        if not self.current_message: 
+        if not message or not message.strip():
             print(f"[WEB ANIMATOR] No message available")
             return
-        words = re.findall(r'\S+|\s+', self.current_message)
-        i = 0
-        n = len(words)
-        delay = 60.0 / self.settings['wpm']
-        print(f'[DEBUG] Starting animation with WPM: {self.settings["wpm"]}, delay: {delay}')
-        last_sentence = ''
-        while i < n and not self._stop_animation_flag:
-            # Start a new sentence
-            sentence_words = []
-            char_count = 0
-            # Build up the sentence word by word, additive
-            while i < n:
-                word = words[i]
-                next_count = char_count + len(word) + (1 if sentence_words else 0)
-                if next_count > self.settings['max_chars']:
-                    break
-                if sentence_words:
-                    char_count += 1  # space
-                sentence_words.append(word.strip())
-                char_count += len(word.strip())
-                # Update the global state for HTTP polling
-                last_sentence = ' '.join(sentence_words)
-                current_display_text = last_sentence
-                last_update_time = time.time()
-                print(f"[WEB ANIMATOR] Updated text: '{last_sentence}'")
-                time.sleep(delay)
-                i += 1
-            # After reaching max_chars, pause before next sentence
-            if i < n:
-                time.sleep(delay)
-        # At the end, keep the last sentence and then fade out
-        if not self._stop_animation_flag:
-            time.sleep(1.0)  # Show the final sentence for 1 second
+        with self._lock:
+            animation_in_progress = True
+            animation_active = True
+        # Outside the lock: the player may call back into _finish, which takes it
+        self.player.submit(message, 60.0 / wpm if wpm else None)
+
+    def set_queue_policy(self, policy, max_depth=None, compress_hold=None):
+        self.player.set_queue_policy(policy, max_depth, compress_hold)
+
+    def _layout(self, message):
+        layout = layout_chunks(message, self.settings['min_chars'], self.settings['max_chars'])
+        return layout, 60.0 / self.settings['wpm']
+
+    def _on_timeline_started(self, message):
+        self.current_message = message
+        timeline = self.player.timeline
+        wpm = 60.0 / timeline.interval if timeline is not None and timeline.interval > 0 else self.settings['wpm']
+        print(f'[WEB ANIMATOR] Starting animation with WPM: {wpm:g}')
+
+    def _show_frame(self, text):
+        """Publish a frame for HTTP polling"""
+        global current_display_text, last_update_time
+        current_display_text = text
+        last_update_time = time.time()
+        print(f"[WEB ANIMATOR] Updated text: '{text}'")
+
+    def _finish(self):
+        global current_display_text, last_update_time, animation_active, animation_in_progress
+        with self._lock:
+            if self.player.is_playing():
+                # A new message arrived while the last one was wrapping up
+                return
             animation_active = False
-            print(f"[WEB ANIMATOR] Animation finished")
-            # Notify main window if callback is set
-            if fade_out_callback:
-                fade_out_callback()
             # Clear the display text after fade out
             current_display_text = ""
             last_update_time = time.time()
-        
-        # Reset animation progress flag
-        global animation_in_progress
-        animation_in_progress = False
-        print(f"[WEB ANIMATOR] Animation finished, flag reset")
+            # Reset animation progress flag
+            animation_in_progress = False
+        print(f"[WEB ANIMATOR] Animation finished")
+        # Notify main window if callback is set
+        if fade_out_callback:
+            fade_out_callback()
 
     def stop_animation(self):
-        self._stop_animation_flag = True
-        if self.animation_thread and self.animation_thread.is_alive():
-            self.animation_thread.join()
+        global animation_in_progress, animation_active
+        self.player.stop()
+        with self._lock:
+            animation_in_progress = False
+            animation_active = False
 
 text_animator = WebTextAnimator()
 
@@ -167,23 +153,32 @@ def health_check():
     """Health check endpoint for the web overlay."""
     return jsonify({'status': 'ok', 'timestamp': time.time()})
 
+@app.route('/api/http_stats')
+def http_stats():
+    """Per-host latency of the app's outgoing HTTP requests (Twitch, overlay notifications)."""
+    return jsonify(latency_stats())
+
 @app.route('/api/current_text')
 def get_current_text():
     """API endpoint for getting current display text (for polling)."""
     global current_display_text, last_update_time, animation_active
-    return jsonify({
+    response = {
         'text': current_display_text,
         'timestamp': last_update_time,
         'active': animation_active
-    })
+    }
+    since = request.args.get('preview_since', type=int)
+    if since is not None:
+        response.update(get_preview_since(since))
+    return jsonify(response)
 
 @app.route('/start_tts_animation', methods=['POST'])
 def start_tts_animation():
     data = request.get_json()
     text = data.get('text', '')
     wpm = data.get('wpm', 180)
-    update_animation_settings(wpm=wpm)
-    update_message(text)
+    # The speed goes with this message; whatever is playing keeps its own
+    update_message(text, wpm=wpm)
     return jsonify({'status': 'ok'})
 
 @app.route('/set_overlay_wpm', methods=['POST'])
@@ -191,24 +186,52 @@ def set_overlay_wpm():
     data = request.get_json()
     wpm = data.get('wpm', 500)
     update_animation_settings(wpm=wpm)
-    # Don't restart animation - just update the settings for future animations
+    # Don't restart animation - the new speed is applied to the remaining frames
     return jsonify({'status': 'ok'})
 
-def update_message(text):
+def update_message(text, wpm=None):
     if multiprocessing.current_process().name != 'MainProcess':
         return
     logger.info(f"[SERVER] update_message called with: {text!r}")
     if text:
-        text_animator.start_animation(text)
+        text_animator.start_animation(text, wpm)
+
+def update_preview(keep, insert):
+    """Record a live-preview edit: the preview becomes preview[:keep] + insert"""
+    global preview_text, preview_seq
+    with preview_lock:
+        preview_text = preview_text[:keep] + insert
+        preview_seq += 1
+        preview_deltas.append((preview_seq, keep, insert))
+
+def get_preview_since(since):
+    """Deltas after sequence number since, or the full preview text if they've been dropped"""
+    with preview_lock:
+        response = {'preview_seq': preview_seq}
+        if since == preview_seq:
+            response['preview_deltas'] = []
+        elif preview_deltas and since >= preview_deltas[0][0] - 1 and since < preview_seq:
+            response['preview_deltas'] = [[keep, insert] for seq, keep, insert in preview_deltas if seq > since]
+        else:
+            response['preview_text'] = preview_text
+        return response
 
 def update_animation_settings(wpm=None, min_chars=None, max_chars=None):
     text_animator.update_settings(wpm, min_chars, max_chars)
 
+def update_queue_policy(policy, max_depth=None, compress_hold=None):
+    text_animator.set_queue_policy(policy, max_depth, compress_hold)
+
 def set_fade_out_callback(callback):
     """Set a callback function to be called when fade_out occurs."""
     global fade_out_callback
     fade_out_callback = callback
 
+class KeepAliveRequestHandler(WSGIRequestHandler):
+    # HTTP/1.1 lets the app's own notifications and the overlay's polling
+    # reuse their connections; the default HTTP/1.0 closes after each response
+    protocol_version = "HTTP/1.1"
+
 def start_server_task():
     logger.info("SERVER THREAD: Starting Flask server...")
     try:
@@ -217,7 +240,8 @@ def start_server_task():
         port = get_config("web_server.port", 5000)
         
         logger.info(f"SERVER THREAD: Starting server on {host}:{port}")
-        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True)
+        app.run(host=host, port=port, debug=False, use_reloader=False, threaded=True,
+                request_handler=KeepAliveRequestHandler)
         
     except Exception as e:
         logger.error(f"SERVER THREAD: A critical error occurred: {e}")
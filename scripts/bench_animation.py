@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from mute_streamer_overload.core.chunk_layout import layout_chunks
+from mute_streamer_overload.core.scheduler import TimerWheelScheduler, VirtualClock
+from mute_streamer_overload.core.timeline import TimelinePlayer
+
+SAMPLE_MESSAGE = (
+    "Thanks for the raid everyone, welcome in! We just finished the boss fight "
+    "and I am absolutely not going to talk about how many attempts it took. "
+    "Grab a drink, get comfy, and let's see what the next area has in store for us."
+)
+
+
+def simulate_message(message, wpm=500, min_chars=10, max_chars=50, hold=1.0, queue_policy="queue"):
+    """Play message on a virtual clock and return the (time, text) frames and the finish time"""
+    clock = VirtualClock()
+    scheduler = TimerWheelScheduler(clock=clock)
+    frames = []
+    finished = []
+    player = TimelinePlayer(
+        lambda msg: (layout_chunks(msg, min_chars, max_chars), 60.0 / wpm),
+        lambda text: frames.append((clock(), text)),
+        lambda: finished.append(clock()),
+        hold=hold,
+        scheduler=scheduler,
+    )
+    player.set_queue_policy(queue_policy)
+    player.submit(message)
+    scheduler.run_until_idle()
+    return frames, finished[0] if finished else None
+
+
+def run_benchmark(runs, message, wpm):
+    layout = layout_chunks(message, 10, 50)
+    expected = sum(layout.pause(i) for i in range(len(layout))) * 60.0 / wpm + 1.0
+    print(f"Message: {len(layout)} words in {len(layout.chunks)} chunks at {wpm} WPM")
+    print(f"Scheduled duration: {expected:.3f}s of animation time per run")
+
+    frames, finish = simulate_message(message, wpm=wpm)
+    print(f"First frames: {[text for _, text in frames[:3]]}")
+    print(f"Finished at t={finish:.3f}s (drift {abs(finish - expected) * 1000:.3f} ms)")
+
+    start = time.perf_counter()
+    for _ in range(runs):
+        simulate_message(message, wpm=wpm)
+    elapsed = time.perf_counter() - start
+    print(f"{runs} runs in {elapsed:.3f}s -> {runs / elapsed:,.0f} runs/s "
+          f"({runs * expected / elapsed:,.0f}x real time)")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Benchmark the animation engine on a virtual clock")
+    parser.add_argument('--runs', type=int, default=2000)
+    parser.add_argument('--wpm', type=int, default=500)
+    parser.add_argument('--message', default=SAMPLE_MESSAGE)
+    args = parser.parse_args()
+    run_benchmark(args.runs, args.message, args.wpm)
@@ -0,0 +1,143 @@
+import argparse
+import os
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import keyboard
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QApplication
+
+from mute_streamer_overload.core.input_handler import InputHandler
+from mute_streamer_overload.ui.overlay_window import OverlayWindow
+from mute_streamer_overload.web import web_server
+
+SAMPLE_TEXT = "gg that was close, thanks for sticking around chat "
+RATES = (5, 15, 40, 120)  # characters per second; 120 is roughly a paste
+
+
+def fake_key(name, when):
+    """Stand-in for keyboard.KeyboardEvent with just what the hook reads"""
+    return SimpleNamespace(name=name, event_type=keyboard.KEY_DOWN, time=when)
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+class LatencyRun:
+    """Types text into an InputHandler at a fixed rate and times each key until it is shown.
+
+    The handler is wired to the overlay and the web server the way
+    MainWindow does it, with live preview on:
+
+    overlay: key injected -> OverlayWindow.apply_preview_delta has applied
+             it and the overlay text has repainted
+    web: key injected -> the web server's preview state holds the text
+    """
+
+    def __init__(self, app, text, rate):
+        self.app = app
+        self.text = text
+        self.rate = rate
+        self.handler = InputHandler()
+        self.handler.set_live_preview(True)
+        self.overlay = OverlayWindow()
+        self.overlay.show()
+        # Same connections as MainWindow; the recorders are connected after
+        # them, so they run once the overlay and the web state are updated
+        self.handler.preview_delta.connect(self.overlay.apply_preview_delta)
+        self.handler.preview_delta.connect(web_server.update_preview)
+        self.handler.preview_delta.connect(self.on_overlay_updated)
+        self.handler.preview_delta.connect(self.on_web_updated)
+        self.injected = []
+        self.overlay_times = []
+        self.web_times = []
+        self.updates = 0
+        self._overlay_seen = 0
+        self._web_seen = 0
+        self.handler.set_active(True)
+
+    def _record(self, shown, seen, samples, when):
+        count = min(shown, len(self.injected))
+        for i in range(seen, count):
+            samples.append(when - self.injected[i])
+        return max(seen, count)
+
+    def on_overlay_updated(self, keep, insert):
+        self.updates += 1
+        self.overlay.message_view.repaint()
+        shown = len(self.overlay.preview_text)
+        self._overlay_seen = self._record(shown, self._overlay_seen, self.overlay_times, time.perf_counter())
+        self._check_done()
+
+    def on_web_updated(self, keep, insert):
+        with web_server.preview_lock:
+            shown = len(web_server.preview_text)
+        self._web_seen = self._record(shown, self._web_seen, self.web_times, time.perf_counter())
+        self._check_done()
+
+    def _check_done(self):
+        if self._overlay_seen == len(self.text) and self._web_seen == len(self.text):
+            self.app.quit()
+
+    def type_text(self):
+        interval = 1.0 / self.rate
+        start = time.perf_counter()
+        for i, char in enumerate(self.text):
+            delay = start + i * interval - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+            self.injected.append(time.perf_counter())
+            # Synthetic timestamps 20 ms apart keep the per-key debounce out of the measurement
+            self.handler.on_key_event(fake_key('space' if char == ' ' else char, 1 + i * 0.02))
+
+    def run(self, timeout):
+        threading.Thread(target=self.type_text, daemon=True).start()
+        deadline = QTimer()
+        deadline.setSingleShot(True)
+        deadline.timeout.connect(self.app.quit)
+        deadline.start(int(timeout * 1000))
+        self.app.exec()
+        deadline.stop()
+        # Stop recording before the preview is cleared on deactivation
+        self.handler.preview_delta.disconnect(self.on_overlay_updated)
+        self.handler.preview_delta.disconnect(self.on_web_updated)
+        self.handler.set_active(False)
+        self.overlay.close()
+
+
+def report(rate, run):
+    if not run.overlay_times or not run.web_times:
+        print(f"{rate:>5} cps: no updates received")
+        return
+    row = [f"{rate:>5} cps", f"{run.updates:>4} updates/{len(run.text)} keys"]
+    for label, values in (("overlay", run.overlay_times), ("web", run.web_times)):
+        stats = " ".join(f"p{p}={percentile(values, p) * 1000:6.2f}" for p in (50, 90, 99))
+        row.append(f"{label}: {stats} max={max(values) * 1000:6.2f} ms")
+    print(" | ".join(row))
+
+
+def run_benchmark(text, rates, timeout):
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    print(f"Typing {len(text)} characters per run")
+    for rate in rates:
+        run = LatencyRun(app, text, rate)
+        run.run(timeout=len(text) / rate + timeout)
+        report(rate, run)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Measure keystroke-to-display latency with synthetic key events")
+    parser.add_argument('--rates', type=int, nargs='+', default=list(RATES),
+                        help="Typing rates to test, in characters per second")
+    parser.add_argument('--repeat', type=int, default=4, help="How many times to type the sample text per run")
+    parser.add_argument('--text', default=SAMPLE_TEXT)
+    parser.add_argument('--timeout', type=float, default=5.0, help="Extra seconds to wait for the last update")
+    args = parser.parse_args()
+    run_benchmark(args.text * args.repeat, args.rates, args.timeout)
@@ -13,6 +13,7 @@ function parseArgs() {
   let i = 0;
   let pitch = 1.0;
   let speed = 1.0;
+  let out = null;
   while (i < args.length) {
     if (!text) {
       text = args[i++];
@@ -23,14 +24,15 @@ function parseArgs() {
     else if (arg === '--volume') volume = parseFloat(args[i++]);
     else if (arg === '--pitch') pitch = parseFloat(args[i++]);
     else if (arg === '--speed') speed = parseFloat(args[i++]);
+    else if (arg === '--out') out = args[i++];
   }
-  return { text, voice, volume, pitch, speed };
+  return { text, voice, volume, pitch, speed, out };
 }
 
 async function main() {
-  const { text, voice, volume, pitch, speed } = parseArgs();
+  const { text, voice, volume, pitch, speed, out } = parseArgs();
   if (!text) {
-    console.error('Usage: bun generate_tts.mjs "Your text here" --voice <voice> --volume <volume> --pitch <pitch> --speed <speed>');
+    console.error('Usage: bun generate_tts.mjs "Your text here" --voice <voice> --volume <volume> --pitch <pitch> --speed <speed> [--out <file.mp3>]');
     process.exit(1);
   }
 
@@ -56,8 +58,8 @@ async function main() {
     if (process.platform === 'win32' && __dirname.startsWith('/')) {
       __dirname = __dirname.slice(1);
     }
-    const speechFile = path.join(__dirname, 'speech.mp3');
-    fs.mkdirSync(__dirname, { recursive: true }); // Ensure directory exists
+    const speechFile = out ? path.resolve(out) : path.join(__dirname, 'speech.mp3');
+    fs.mkdirSync(path.dirname(speechFile), { recursive: true }); // Ensure directory exists
     fs.writeFileSync(speechFile, mp3Buffer);
 
     // Amplify the MP3 by volume factor (default 1.0 = no change)
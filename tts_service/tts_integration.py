@@ -3,11 +3,25 @@ import os
 import pygame
 import time
 import sys
-from mute_streamer_overload.utils.config import get_config, auto_update_wpm_for_tts_speed
-import requests
+import re
+import itertools
+import threading
+from collections import OrderedDict
+from mute_streamer_overload.utils.config import config_key, auto_update_wpm_for_tts_speed
+from mute_streamer_overload.utils import http_client
 import shutil
 import logging
 import tempfile
+import atexit
+
+# Read on every message; precompiled so they only hit the config dict after a change
+TTS_VOICE = config_key("tts.voice", "en-US-AvaMultilingualNeural")
+TTS_SPEED = config_key("tts.speed", 1.0)
+TTS_PITCH = config_key("tts.pitch", 1.0)
+TTS_VOLUME = config_key("tts.volume", 1.0)
+SYNC_OVERLAY_WPM = config_key("tts.sync_overlay_wpm_with_tts", True)
+SPECULATIVE_SYNTHESIS = config_key("tts.speculative_synthesis", True)
+WORDS_PER_MINUTE = config_key("animation.words_per_minute", 500)
 
 def resource_path(relative_path):
     """Get absolute path to resource, works for dev and for PyInstaller."""
@@ -20,9 +34,11 @@ def tts_log(msg):
     print(msg)
     logging.debug(msg)
 
-def generate_tts(text, voice, speed, pitch, volume):
+def generate_tts(text, voice, speed, pitch, volume, output_file=None, job=None):
     """
     Calls the generate_tts.mjs script using bun to generate speech.mp3 from the given text and settings.
+    output_file writes the audio somewhere else instead; passing a SpeculativeJob
+    lets job.cancel() kill the subprocess mid-generation.
     Returns True if successful, False otherwise.
     """
     # Handle paths for both development and PyInstaller bundle
@@ -66,15 +82,18 @@ def generate_tts(text, voice, speed, pitch, volume):
         '--pitch', str(pitch),
         '--volume', str(volume)
     ]
+    if output_file:
+        subprocess_args += ['--out', output_file]
     
     tts_log(f'TTS call args: {text}, {voice}, {speed}, {pitch}, {volume}')
     
     # Set up subprocess kwargs
     kwargs = {
         'cwd': tts_service_dir,
-        'capture_output': True,
+        'stdout': subprocess.PIPE,
+        'stderr': subprocess.PIPE,
         'text': True
-        # Removed timeout from here since it's passed separately to subprocess.run()
+        # Timeout is passed separately to communicate()
     }
     # Prevent console window on Windows
     if os.name == 'nt':
@@ -82,7 +101,15 @@ def generate_tts(text, voice, speed, pitch, volume):
 
     tts_log(f"Running command: {' '.join(subprocess_args)} in cwd: {kwargs['cwd']}")
     try:
-        result = subprocess.run(subprocess_args, **kwargs, timeout=60)  # Increased timeout to 60 seconds
+        process = subprocess.Popen(subprocess_args, **kwargs)
+        if job is not None:
+            job.attach(process)
+        try:
+            stdout, stderr = process.communicate(timeout=60)  # Increased timeout to 60 seconds
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.communicate()
+            raise
     except subprocess.TimeoutExpired:
         tts_log('TTS subprocess timed out after 60 seconds!')
         return False
@@ -93,16 +120,19 @@ def generate_tts(text, voice, speed, pitch, volume):
         tts_log(f'TTS subprocess failed with exception: {e}')
         return False
         
+    if job is not None and job.cancelled:
+        tts_log(f'TTS job cancelled: {text}')
+        return False
     tts_log('TTS subprocess stdout:')
-    tts_log(result.stdout)
-    if result.returncode != 0:
+    tts_log(stdout)
+    if process.returncode != 0:
         tts_log('TTS subprocess stderr:')
-        tts_log(result.stderr)
-        tts_log(f"TTS generation failed with return code {result.returncode}")
+        tts_log(stderr)
+        tts_log(f"TTS generation failed with return code {process.returncode}")
         return False
     
     # Check if the output file was created
-    output_file = os.path.join(tts_service_dir, 'speech.mp3')
+    output_file = output_file or os.path.join(tts_service_dir, 'speech.mp3')
     if not os.path.exists(output_file):
         tts_log(f'TTS ERROR: Output file not found at {output_file}')
         return False
@@ -112,13 +142,13 @@ def generate_tts(text, voice, speed, pitch, volume):
 
 def notify_overlay_start(text, wpm):
     try:
-        requests.post('http://127.0.0.1:5000/start_tts_animation', json={'text': text, 'wpm': wpm})
+        http_client.post('http://127.0.0.1:5000/start_tts_animation', json={'text': text, 'wpm': wpm})
     except Exception as e:
         tts_log(f"Failed to notify overlay: {e}")
 
-def play_tts(text, speed):
+def play_tts(text, speed, mp3_path=None, notify=True):
     """
-    Plays the generated speech.mp3 file and notifies the overlay to start animation.
+    Plays the generated speech.mp3 file (or mp3_path) and notifies the overlay to start animation.
     """
     # Always use the tts_service folder next to the executable or main.py
     if getattr(sys, 'frozen', False):
@@ -127,7 +157,7 @@ def play_tts(text, speed):
         tts_service_dir = os.path.abspath(os.path.join(exe_dir, '..', '..', 'tts_service'))
     else:
         tts_service_dir = os.path.dirname(__file__)
-    mp3_path = os.path.join(tts_service_dir, 'speech.mp3')
+    mp3_path = mp3_path or os.path.join(tts_service_dir, 'speech.mp3')
     if not os.path.exists(mp3_path):
         tts_log(f"MP3 file not found: {mp3_path}")
         return
@@ -138,11 +168,12 @@ def play_tts(text, speed):
     while not pygame.mixer.music.get_busy():
         pygame.time.Clock().tick(10)
     # Now notify overlay
-    if get_config("tts.sync_overlay_wpm_with_tts", True):
-        wpm = 500 * speed
-    else:
-        wpm = get_config("animation.words_per_minute", 500)
-    notify_overlay_start(text, wpm)
+    if notify:
+        if SYNC_OVERLAY_WPM.get():
+            wpm = 500 * speed
+        else:
+            wpm = WORDS_PER_MINUTE.get()
+        notify_overlay_start(text, wpm)
     while pygame.mixer.music.get_busy():
         pygame.time.Clock().tick(10)
     # Unload the music to release the file lock (Windows)
@@ -152,6 +183,152 @@ def play_tts(text, speed):
         pass
     pygame.mixer.quit()
 
+# A speculative result can be reused for a longer submission only if it
+# ended a sentence, so the two clips join at a natural pause
+SENTENCE_END = re.compile(r'[.!?]["\')\]]*$')
+
+
+def _tts_settings():
+    return TTS_VOICE.get(), TTS_SPEED.get(), TTS_PITCH.get(), TTS_VOLUME.get()
+
+
+class SpeculativeJob:
+    """One background synthesis; cancel() is cheap and kills the subprocess if it is running"""
+
+    def __init__(self, text, settings, path):
+        self.text = text
+        self.settings = settings
+        self.path = path
+        self.cancelled = False
+        self.process = None
+        self.done = threading.Event()
+        self._lock = threading.Lock()
+
+    def attach(self, process):
+        with self._lock:
+            self.process = process
+            if self.cancelled:
+                process.kill()
+
+    def cancel(self):
+        with self._lock:
+            self.cancelled = True
+            if self.process is not None and self.process.poll() is None:
+                self.process.kill()
+
+
+class SpeculativeTTS:
+    """Synthesizes text while the user is still typing, keyed by (text, settings).
+
+    Text is stripped on both sides, so a submitted message with trailing
+    whitespace still finds what was synthesized while it was typed.
+
+    speculate() runs at most one job at a time; a new request cancels the
+    previous one. take() looks up a result for the text being submitted:
+    either an exact match, or a finished result for a sentence-ending
+    prefix of it, in which case only the remainder needs synthesizing.
+    """
+    MAX_RESULTS = 4
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._job = None
+        self._results = OrderedDict()
+        self._counter = itertools.count()
+        self._dir = None
+
+    def new_path(self):
+        if self._dir is None:
+            self._dir = tempfile.mkdtemp(prefix='mso_tts_')
+        return os.path.join(self._dir, f'speculative_{next(self._counter)}.mp3')
+
+    def speculate(self, text, settings):
+        text = text.strip()
+        key = (text, settings)
+        with self._lock:
+            if key in self._results:
+                return
+            if self._job is not None:
+                if (self._job.text, self._job.settings) == key:
+                    return
+                self._job.cancel()
+            job = self._job = SpeculativeJob(text, settings, self.new_path())
+        tts_log(f'[TTS] Speculative synthesis: {text}')
+        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+
+    def _run(self, job):
+        ok = generate_tts(job.text, *job.settings, output_file=job.path, job=job)
+        with self._lock:
+            if self._job is job:
+                self._job = None
+            if ok and not job.cancelled:
+                self._results[(job.text, job.settings)] = job.path
+                while len(self._results) > self.MAX_RESULTS:
+                    _, path = self._results.popitem(last=False)
+                    self.discard(path)
+            else:
+                self.discard(job.path)
+        job.done.set()
+
+    def take(self, text, settings):
+        """Return (mp3 path, remaining text) to play text from, or None.
+
+        Waits for a job that is already synthesizing exactly this text
+        rather than starting over. Any other in-flight job is stale by
+        now and gets cancelled.
+        """
+        text = text.strip()
+        with self._lock:
+            job = self._job
+            if job is not None and (job.text, job.settings) != (text, settings):
+                job.cancel()
+                job = None
+        if job is not None:
+            job.done.wait(timeout=60)
+        with self._lock:
+            path = self._results.get((text, settings))
+            if path:
+                return path, ""
+            best = None
+            for (prefix, prefix_settings), path in self._results.items():
+                if (prefix_settings == settings and SENTENCE_END.search(prefix)
+                        and text.startswith(prefix) and text[len(prefix):len(prefix) + 1].isspace()
+                        and (best is None or len(prefix) > len(best[0]))):
+                    best = (prefix, path)
+            if best is None:
+                return None
+            return best[1], text[len(best[0]):].strip()
+
+    def discard(self, path):
+        """Delete an audio file made with new_path() that is no longer needed"""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def shutdown(self):
+        """Cancel the running job and delete the temp directory with all results"""
+        with self._lock:
+            if self._job is not None:
+                self._job.cancel()
+                self._job = None
+            self._results.clear()
+            directory, self._dir = self._dir, None
+        if directory is not None:
+            shutil.rmtree(directory, ignore_errors=True)
+
+
+speculator = SpeculativeTTS()
+# Don't leave synthesized audio behind in the temp directory
+atexit.register(speculator.shutdown)
+
+
+def speculate(text):
+    """Start synthesizing text in the background in case it gets submitted as is"""
+    if text and SPECULATIVE_SYNTHESIS.get():
+        speculator.speculate(text, _tts_settings())
+
+
 def speak(text):
     """
     Generates TTS for the given text and plays it if successful.
@@ -160,12 +337,31 @@ def speak(text):
     if pygame.mixer.get_init() and pygame.mixer.music.get_busy():
         while pygame.mixer.music.get_busy():
             time.sleep(0.1)
-    voice = get_config("tts.voice", "en-US-AvaMultilingualNeural")
-    speed = get_config("tts.speed", 1.0)
-    pitch = get_config("tts.pitch", 1.0)
-    volume = get_config("tts.volume", 1.0)
+    settings = _tts_settings()
+    voice, speed, pitch, volume = settings
     # Only auto-update WPM if sync is enabled
-    if get_config("tts.sync_overlay_wpm_with_tts", True):
+    if SYNC_OVERLAY_WPM.get():
         auto_update_wpm_for_tts_speed(speed)
+    hit = speculator.take(text, settings)
+    if hit:
+        path, rest = hit
+        tts_log(f'[TTS] Using speculative audio, {len(rest)} chars left to synthesize')
+        if not rest:
+            play_tts(text, speed, path)
+            return
+        # Play the synthesized prefix right away and generate the rest meanwhile
+        rest_path = speculator.new_path()
+        rest_ok = []
+        worker = threading.Thread(target=lambda: rest_ok.append(
+            generate_tts(rest, voice, speed, pitch, volume, output_file=rest_path)), daemon=True)
+        worker.start()
+        play_tts(text, speed, path)
+        worker.join()
+        try:
+            if rest_ok and rest_ok[0]:
+                play_tts(rest, speed, rest_path, notify=False)
+        finally:
+            speculator.discard(rest_path)
+        return
     if generate_tts(text, voice, speed, pitch, volume):
         play_tts(text, speed)
\ No newline at end of file